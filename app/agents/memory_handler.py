@@ -20,11 +20,11 @@ OTE COMPLIANCE:
     - Evaluation: Success rates, persistence metrics
 """
 
-import json
 from typing import Dict, List, Any, Optional
 from langchain_core.messages import HumanMessage, AIMessage
 
 from app.utils import get_logger, observe, traceable, evaluate
+from app.utils import fast_json
 
 # Get logger for this module
 logger = get_logger(__name__)
@@ -46,6 +46,7 @@ class MemoryHandler:
     Attributes:
         memory_agent: UserAgent instance for encrypted memory management
         conversation_tool: ConversationRecallTool for retrieving history
+        recent_messages: Bounded in-memory tail of saved messages (optional)
     
     Example:
         >>> handler = MemoryHandler(memory_agent, conversation_tool)
@@ -56,18 +57,27 @@ class MemoryHandler:
         15
     """
     
-    def __init__(self, memory_agent: Any, conversation_tool: Any):
+    def __init__(
+        self,
+        memory_agent: Any,
+        conversation_tool: Any,
+        recent_messages: Optional[Any] = None
+    ):
         """
         Initialize MemoryHandler.
         
         Args:
             memory_agent: UserAgent instance for memory management
             conversation_tool: ConversationRecallTool for retrieving history
+            recent_messages: Deque-like object (e.g. RollingHistory) that every
+                saved message is also appended to, letting callers keep
+                recent history without re-reading it
         """
         logger.trace("INIT", "Initializing MemoryHandler")
         
         self.memory_agent = memory_agent
         self.conversation_tool = conversation_tool
+        self.recent_messages = recent_messages
         
         logger.observe(
             "init_complete",
@@ -128,6 +138,12 @@ class MemoryHandler:
             logger.error(f"⚠️ Error saving to memory: {e}", exc_info=True)
             logger.observe("save_complete", success=False, error=str(e))
     
+    def _add_to_memory(self, entry: Dict[str, Any]) -> None:
+        """Add a message to encrypted memory and the recent-messages tail."""
+        self.memory_agent.add_to_memory(entry)
+        if self.recent_messages is not None:
+            self.recent_messages.append(entry)
+    
     @traceable()
     def _extract_and_save_user_message(self, messages: List) -> bool:
         """
@@ -153,7 +169,7 @@ class MemoryHandler:
             if hasattr(msg, 'type') and msg.type == 'human':
                 content = getattr(msg, 'content', '')
                 if content:
-                    self.memory_agent.add_to_memory({
+                    self._add_to_memory({
                         "role": "user",
                         "content": content,
                         "type": "ai"  # Marks as AI conversation
@@ -165,7 +181,7 @@ class MemoryHandler:
             elif isinstance(msg, dict) and msg.get('role') == 'user':
                 content = msg.get('content', '')
                 if content:
-                    self.memory_agent.add_to_memory({
+                    self._add_to_memory({
                         "role": "user",
                         "content": content,
                         "type": "ai"
@@ -177,7 +193,7 @@ class MemoryHandler:
             elif hasattr(msg, '__class__') and msg.__class__.__name__ == 'HumanMessage':
                 content = msg.content
                 if content:
-                    self.memory_agent.add_to_memory({
+                    self._add_to_memory({
                         "role": "user",
                         "content": content,
                         "type": "ai"
@@ -217,7 +233,7 @@ class MemoryHandler:
             if isinstance(msg, dict) and 'content' in msg:
                 content = msg.get('content', '')
                 if content:
-                    self.memory_agent.add_to_memory({
+                    self._add_to_memory({
                         "role": msg.get('role', 'assistant'),
                         "content": content,
                         "type": "ai"
@@ -235,7 +251,7 @@ class MemoryHandler:
                 if not has_tool_calls:
                     content = getattr(msg, 'content', '')
                     if content:
-                        self.memory_agent.add_to_memory({
+                        self._add_to_memory({
                             "role": "assistant",
                             "content": content,
                             "type": "ai"
@@ -268,12 +284,12 @@ class MemoryHandler:
         logger.trace("RECALL", f"Retrieving history for user_id={user_id}")
         
         try:
-            # Call conversation recall tool
-            result = self.conversation_tool._run(user_id)
+            # Prefer the tool's native dict; fall back to parsing its JSON output
+            recall = getattr(self.conversation_tool, "recall", None)
+            result = recall(user_id) if recall else self.conversation_tool._run(user_id)
             
             if result:
-                # Parse result (may be dict or JSON string)
-                result_data = result if isinstance(result, dict) else json.loads(result)
+                result_data = result if isinstance(result, dict) else fast_json.loads(result)
                 
                 if result_data.get("status") == "success" and "data" in result_data:
                     history = result_data["data"]
@@ -21,16 +21,30 @@ OTE COMPLIANCE:
     - Evaluation: Success/failure rates per tool, execution timing
 """
 
-import json
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
 from langchain_core.messages import ToolMessage
 
 from app.utils import get_logger, observe, traceable, evaluate
+from app.utils import fast_json
 from app.agents.response_handler import ResponseHandler
 
 # Get logger for this module
 logger = get_logger(__name__)
 
+# Shared pool for running calls to different tools from one AIMessage
+# concurrently; tools are I/O bound (DB, HTTP), so a turn takes max() rather
+# than sum() of their latencies. Calls to the same tool stay sequential, since
+# a tool instance is not guaranteed to be thread-safe.
+_TOOL_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="tool")
+
+
+def _unwrap_query(tool_args: Any) -> Any:
+    """Pass {"query": q} as bare q, as search-style tools expect."""
+    if isinstance(tool_args, dict) and "query" in tool_args:
+        return tool_args["query"]
+    return tool_args
+
 
 class ToolHandler:
     """
@@ -47,6 +61,7 @@ class ToolHandler:
     
     Attributes:
         tools_by_name: Dictionary mapping tool names to tool instances
+        invokers_by_name: Dictionary mapping tool names to prebuilt invokers
         response_handler: ResponseHandler for formatting results
     
     Example:
@@ -73,6 +88,15 @@ class ToolHandler:
             if tool_name:
                 self.tools_by_name[tool_name] = tool
         
+        # Resolve each tool's invocation style once instead of per call
+        self.invokers_by_name = {
+            name: self._make_invoker(tool, name)
+            for name, tool in self.tools_by_name.items()
+        }
+        
+        # Tool set is fixed after construction; render its listing once
+        self._available_tools_text = str(list(self.tools_by_name.keys()))
+        
         # Use provided handler or create default
         self.response_handler = response_handler or ResponseHandler()
         
@@ -114,8 +138,8 @@ class ToolHandler:
         Execute tools requested in the last AIMessage.
         
         TRACE PATH:
-            VALIDATE → For each tool:
-                TOOL_LOOKUP → EXECUTE → FORMAT
+            VALIDATE → For each tool (different tools concurrently, calls to
+                the same tool in order): TOOL_LOOKUP → EXECUTE → FORMAT
         
         Args:
             inputs: Dictionary with "messages" key containing message history
@@ -143,10 +167,24 @@ class ToolHandler:
         tool_count = len(message.tool_calls)
         logger.trace("VALIDATE", f"Found {tool_count} tool calls to execute")
         
-        outputs = []
-        for tool_call in message.tool_calls:
-            tool_message = self._execute_single_tool(tool_call)
-            outputs.append(tool_message)
+        # One batch per tool name: batches run in parallel, the calls within
+        # a batch in order; results keep the order of tool_calls
+        batches: Dict[Any, List[int]] = {}
+        for index, tool_call in enumerate(message.tool_calls):
+            batches.setdefault(tool_call.get("name"), []).append(index)
+        
+        if len(batches) == 1:
+            outputs = self._execute_tool_batch(message.tool_calls)
+        else:
+            outputs: List[Any] = [None] * tool_count
+            indices = list(batches.values())
+            results = _TOOL_EXECUTOR.map(
+                self._execute_tool_batch,
+                [[message.tool_calls[i] for i in batch] for batch in indices]
+            )
+            for batch, batch_outputs in zip(indices, results):
+                for index, output in zip(batch, batch_outputs):
+                    outputs[index] = output
         
         success_count = sum(1 for msg in outputs if '"error"' not in msg.content)
         logger.observe(
@@ -159,6 +197,10 @@ class ToolHandler:
         
         return {"messages": outputs}
     
+    def _execute_tool_batch(self, tool_calls: List[Dict[str, Any]]) -> List[ToolMessage]:
+        """Execute tool calls one after another (calls to the same tool)."""
+        return [self._execute_single_tool(tool_call) for tool_call in tool_calls]
+    
     @traceable()
     @observe("execute_single_tool")
     def _execute_single_tool(self, tool_call: Dict[str, Any]) -> ToolMessage:
@@ -186,22 +228,22 @@ class ToolHandler:
         logger.trace("TOOL_LOOKUP", f"Looking up tool: {tool_name}")
         
         # TRACE POINT 2: Tool lookup
-        if tool_name not in self.tools_by_name:
+        invoke = self.invokers_by_name.get(tool_name)
+        if invoke is None:
             logger.warning(f"Tool not found: {tool_name}")
-            error_msg = f"Tool '{tool_name}' not found. Available tools: {list(self.tools_by_name.keys())}"
+            error_msg = f"Tool '{tool_name}' not found. Available tools: {self._available_tools_text}"
             logger.observe("tool_executed", tool=tool_name, success=False, reason="not_found")
             return ToolMessage(
-                content=json.dumps({"error": error_msg}),
+                content=fast_json.dumps({"error": error_msg}),
                 name=tool_name,
                 tool_call_id=tool_call_id,
             )
         
-        tool = self.tools_by_name[tool_name]
         logger.trace("EXECUTE", f"Executing {tool_name} with args: {str(tool_args)[:100]}")
         
         # TRACE POINT 3: Tool execution
         try:
-            tool_result = self._invoke_tool(tool, tool_name, tool_args)
+            tool_result = invoke(tool_args)
             logger.trace("FORMAT", f"Formatting result for {tool_name}")
             
             # TRACE POINT 4: Format result
@@ -226,17 +268,17 @@ class ToolHandler:
             logger.observe("tool_executed", tool=tool_name, success=False, error=str(e))
             
             return ToolMessage(
-                content=json.dumps({
+                content=fast_json.dumps({
                     "error": f"Error calling tool {tool_name}: {str(e)}"
                 }),
                 name=tool_name,
                 tool_call_id=tool_call_id,
             )
     
-    @traceable()
-    def _invoke_tool(self, tool: Any, tool_name: str, tool_args: Any) -> Any:
+    @staticmethod
+    def _make_invoker(tool: Any, tool_name: str) -> Callable[[Any], Any]:
         """
-        Invoke a tool with proper argument handling.
+        Build a callable that invokes a tool with proper argument handling.
         
         Handles different tool invocation patterns:
         - Tools with .invoke() method
@@ -246,42 +288,30 @@ class ToolHandler:
         Args:
             tool: Tool instance
             tool_name: Name of the tool
-            tool_args: Arguments for the tool
             
         Returns:
-            Any: Tool execution result
-            
-        Raises:
-            Exception: If tool execution fails
+            Callable[[Any], Any]: Takes the tool args and returns the tool result
         """
-        logger.trace("EXECUTE", f"Invoking {tool_name}, has_invoke={hasattr(tool, 'invoke')}")
-        
         # Tools with invoke method
         if hasattr(tool, "invoke"):
             # Special handling for tavily_search
             if tool_name == "tavily_search":
-                if isinstance(tool_args, dict) and "query" in tool_args:
-                    return tool.invoke(tool_args["query"])
-                elif isinstance(tool_args, str):
-                    return tool.invoke(tool_args)
-                else:
-                    return tool.invoke(tool_args)
-            else:
-                # Standard invoke for other tools
-                return tool.invoke(tool_args)
+                return lambda tool_args: tool.invoke(_unwrap_query(tool_args))
+            # Standard invoke for other tools
+            return tool.invoke
         
         # Callable tools
-        elif callable(tool):
-            if isinstance(tool_args, dict) and "query" in tool_args:
-                return tool.invoke(tool_args["query"])
-            else:
-                return tool.invoke(tool_args)
+        if callable(tool):
+            return lambda tool_args: tool(_unwrap_query(tool_args))
         
         # Not callable
-        else:
-            error_msg = f"Tool {tool_name} is not callable"
+        error_msg = f"Tool {tool_name} is not callable"
+        
+        def not_callable(tool_args: Any) -> Dict[str, str]:
             logger.error(error_msg)
             return {"error": error_msg}
+        
+        return not_callable
     
     @traceable()
     def get_tool_names(self) -> List[str]:
@@ -1,4 +1,5 @@
 from typing import Dict, Optional, List, Any
+import logging
 import threading
 from pathlib import Path
 import sys
@@ -11,6 +12,8 @@ if project_root not in sys.path:
 from ai_chatagent import AiChatagent, dm, llm
 from datamanager.data_model import User
 
+logger = logging.getLogger(__name__)
+
 class AIAgentManager:
     _instance = None
     _lock = threading.Lock()
@@ -135,9 +138,7 @@ class AIAgentManager:
                 
         except Exception as e:
             error_msg = f"Error processing AI message: {str(e)}"
-            print(error_msg)
-            import traceback
-            traceback.print_exc()
+            logger.exception(error_msg)
             return {
                 "response": f"I'm sorry, I encountered an error: {str(e)}",
                 "thread_id": thread_id or str(user_id),
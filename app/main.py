@@ -4,6 +4,7 @@ import asyncio
 import logging
 import os
 import time
+import traceback
 import uuid
 from datetime import datetime, date, timedelta
 from pathlib import Path
@@ -775,7 +776,6 @@ async def send_ai_response(username: str, message: str):
                 ai_response = str(ai_response)
                 
         except Exception as e:
-            import traceback
             error_trace = traceback.format_exc()
             print(f"Error processing AI message: {e}\n{error_trace}")
             ai_response = "I encountered an error while processing your request. Please try again."
@@ -5,7 +5,8 @@ Uses Fernet (symmetric encryption) from cryptography library.
 Personal user data is encrypted at rest and only accessible to authenticated users.
 """
 import os
-from typing import Optional
+import threading
+from typing import List, Optional
 from cryptography.fernet import Fernet
 from dotenv import load_dotenv
 
@@ -102,6 +103,32 @@ class DataEncryption:
         except Exception as e:
             raise ValueError(f"Decryption failed: {str(e)}")
     
+    def decrypt_many(self, encrypted_values: List[str]) -> List[Optional[str]]:
+        """
+        Decrypt several values with the shared cipher in one call.
+        
+        Unlike decrypt(), a bad token does not abort the batch; its slot
+        is None so callers can keep the stored value and carry on.
+        
+        Args:
+            encrypted_values: Base64-encoded encrypted strings
+            
+        Returns:
+            List[Optional[str]]: Plain text in input order, None where
+                decryption failed
+        """
+        decrypt = self._fernet.decrypt
+        results: List[Optional[str]] = []
+        for value in encrypted_values:
+            if not value:
+                results.append("")
+                continue
+            try:
+                results.append(decrypt(value.encode()).decode())
+            except Exception:
+                results.append(None)
+        return results
+    
     def is_encrypted(self, data: str) -> bool:
         """
         Check if data appears to be encrypted.
@@ -121,17 +148,24 @@ class DataEncryption:
 
 # Global instance for easy access
 _encryptor = None
+_encryptor_lock = threading.Lock()
 
 def get_encryptor() -> DataEncryption:
     """
     Get singleton encryptor instance.
     
+    The cipher is built once per process; the lock keeps concurrent first
+    calls from creating two encryptors (with two different temporary keys
+    when USER_DATA_ENCRYPTION_KEY is unset).
+    
     Returns:
         DataEncryption: Global encryptor instance
     """
     global _encryptor
     if _encryptor is None:
-        _encryptor = DataEncryption()
+        with _encryptor_lock:
+            if _encryptor is None:
+                _encryptor = DataEncryption()
     return _encryptor
 
 
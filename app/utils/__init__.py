@@ -11,11 +11,14 @@ Modules:
     - ote_logger: OTE-compliant logging
     - metrics: Performance tracking and evaluation
     - decorators: Reusable decorators for OTE compliance
+    - llm_cache: Exact-match LLM response cache
+    - fast_json: orjson-backed dumps/loads with stdlib fallback
 """
 
 from app.utils.ote_logger import OTELogger, get_logger
 from app.utils.metrics import PerformanceMetrics, metrics_tracker
 from app.utils.decorators import observe, traceable, evaluate
+from app.utils.llm_cache import LLMResponseCache, get_llm_cache, make_cache_key, normalize_text
 
 __all__ = [
     'OTELogger',
@@ -25,4 +28,8 @@ __all__ = [
     'observe',
     'traceable',
     'evaluate',
+    'LLMResponseCache',
+    'get_llm_cache',
+    'make_cache_key',
+    'normalize_text',
 ]
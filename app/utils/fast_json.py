@@ -0,0 +1,63 @@
+"""
+Fast JSON Helpers
+
+LOCATION: app/utils/fast_json.py
+PURPOSE: JSON encode/decode for hot paths (tool results, history recall)
+
+Uses orjson (C extension) when installed and falls back to the stdlib json
+module otherwise, so callers never need to care which backend is active.
+
+USAGE:
+    from app.utils.fast_json import dumps, loads
+
+    content = dumps({"error": "Tool not found"})   # always returns str
+    data = loads(content)
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def dumps(obj: Any) -> str:
+    """
+    Serialize obj to a JSON string.
+
+    Unlike json.dumps, non-ASCII characters are emitted as-is and the
+    output has no whitespace after separators (with either backend).
+    Values that are not JSON-native are converted with str().
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        JSON text
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(obj, default=str, ensure_ascii=False, separators=(",", ":"))
+
+
+def loads(data: Any) -> Any:
+    """
+    Parse JSON text (str or bytes).
+
+    Args:
+        data: JSON document
+
+    Returns:
+        Parsed Python object
+
+    Raises:
+        ValueError: If data is not valid JSON (both backends' decode
+            errors subclass ValueError)
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,191 @@
+"""
+LLM Response Cache - Exact-Match Layer
+
+LOCATION: app/utils/llm_cache.py
+PURPOSE: Skip repeated LLM round trips for identical prompts
+
+PRINCIPLE: Observability (O in OTE)
+    - Hits and misses counted in stats
+    - Cache errors logged, never raised to the caller
+
+USAGE:
+    from app.utils.llm_cache import get_llm_cache, make_cache_key, normalize_text
+
+    cache = get_llm_cache()  # None unless LLM_CACHE_ENABLED=true
+    key = make_cache_key(text=normalize_text(text), target_language="English", model="gpt-4o-mini")
+    cached = cache.get(key)
+    if cached is None:
+        cached = llm.invoke(prompt).content
+        cache.set(key, cached)
+
+CONFIGURATION (environment):
+    - LLM_CACHE_ENABLED: "true" enables the cache (default: disabled, since
+      entries contain user message text)
+    - LLM_CACHE_PATH: SQLite file; relative paths are resolved against the
+      project root (default: data/llm_cache.sqlite.db)
+    - LLM_CACHE_TTL: Entry lifetime in seconds (default: 86400)
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from app.utils.ote_logger import get_logger
+
+logger = get_logger(__name__)
+
+# Relative LLM_CACHE_PATH values are resolved here, not against the CWD
+_PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+# Runs of whitespace, collapsed when building cache keys
+_SPACE_RE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """
+    Canonicalize text for a cache key without changing its meaning.
+
+    Only the Unicode composition (NFC) and whitespace are normalized.
+    Case, accents, punctuation and emoji are kept because they change
+    meaning and tone ("año" vs "ano", "great." vs "GREAT?!").
+
+    Args:
+        text: Raw user text
+
+    Returns:
+        Normalized text for use in make_cache_key
+    """
+    return _SPACE_RE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+def make_cache_key(**params: Any) -> str:
+    """
+    Build a stable SHA-256 key from the parameters that affect the output.
+
+    Args:
+        **params: JSON-serializable values (text, languages, model, ...)
+
+    Returns:
+        Hex digest identifying the request
+    """
+    payload = json.dumps(params, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """
+    SQLite-backed exact-match cache for LLM responses.
+
+    A single connection is shared behind a lock; SQLite lookups by primary
+    key take microseconds compared to seconds for an LLM call.
+
+    Attributes:
+        db_path: Path of the SQLite cache file
+        ttl: Entry lifetime in seconds
+        stats: Hit/miss counters
+    """
+
+    def __init__(self, db_path: str, ttl: int = 86400):
+        """
+        Initialize cache and create its table if needed.
+
+        Args:
+            db_path: Path of the SQLite cache file
+            ttl: Entry lifetime in seconds
+        """
+        self.db_path = db_path
+        self.ttl = ttl
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0}
+        self._lock = threading.Lock()
+
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+
+        from datamanager.data_model import tune_connection
+        tune_connection(self._conn)
+
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+        logger.trace("INIT", f"LLM cache ready at {db_path} (ttl={ttl}s)")
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Return the cached value for key, or None on miss/expiry.
+
+        Args:
+            key: Cache key from make_cache_key
+
+        Returns:
+            Cached response text or None
+        """
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value, created_at FROM llm_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None or time.time() - row[1] > self.ttl:
+                    self.stats["misses"] += 1
+                    return None
+                self.stats["hits"] += 1
+                return row[0]
+        except sqlite3.Error as e:
+            logger.warning(f"LLM cache read failed: {e}")
+            return None
+
+    def set(self, key: str, value: str) -> None:
+        """
+        Store a response under key.
+
+        Args:
+            key: Cache key from make_cache_key
+            value: Response text to store
+        """
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, value, created_at) VALUES (?, ?, ?)",
+                    (key, value, time.time())
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"LLM cache write failed: {e}")
+
+
+_llm_cache: Optional[LLMResponseCache] = None
+_llm_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> Optional[LLMResponseCache]:
+    """
+    Get the process-wide LLM cache (singleton pattern).
+
+    The cache is opt-in: it stores user message text on disk, so it is
+    only used when LLM_CACHE_ENABLED is set to a true value.
+
+    Returns:
+        LLMResponseCache, or None unless enabled via LLM_CACHE_ENABLED=true
+    """
+    global _llm_cache
+
+    if os.getenv("LLM_CACHE_ENABLED", "false").lower() not in ("1", "true", "yes"):
+        return None
+
+    if _llm_cache is None:
+        with _llm_cache_lock:
+            if _llm_cache is None:
+                _llm_cache = LLMResponseCache(
+                    db_path=str(_PROJECT_ROOT / os.getenv("LLM_CACHE_PATH", "data/llm_cache.sqlite.db")),
+                    ttl=int(os.getenv("LLM_CACHE_TTL", "86400"))
+                )
+    return _llm_cache
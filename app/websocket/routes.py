@@ -710,7 +710,5 @@ async def websocket_room_endpoint(
         await handle_room_websocket(websocket, room_id, user)
         
     except Exception as e:
-        logger.error(f"Error in room WebSocket: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"Error in room WebSocket: {e}")
         await websocket.close(code=status.WS_1011_INTERNAL_ERROR)
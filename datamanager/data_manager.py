@@ -1,6 +1,9 @@
 import datetime
 import json
-from typing import List, Optional, Any
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Tuple
 from contextlib import contextmanager
 
 # Import models from parent directory
@@ -10,6 +13,59 @@ from datamanager.data_model import (
 )
 
 
+class _UserRowsCache:
+    """Read-through cache of per-user rows shared by every DataManager in the process.
+
+    Entries are keyed by (database URL, user_id) so a write through any
+    DataManager on the same database invalidates what the others serve.
+    Writers call invalidate() after their commit; readers pass the
+    generation they saw before querying to put(), so rows loaded before
+    a concurrent commit are never stored. The TTL bounds staleness from
+    writes made outside DataManager.
+    """
+
+    def __init__(self, ttl: float = 60.0, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Tuple[str, int], Tuple[float, Optional[list]]]" = OrderedDict()
+        self._generations: Dict[Tuple[str, int], int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, int]) -> Tuple[bool, Optional[list]]:
+        """Return (hit, copy of the cached rows)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry[0] >= self.ttl:
+                return False, None
+            self._entries.move_to_end(key)
+            return True, None if entry[1] is None else list(entry[1])
+
+    def generation(self, key: Tuple[str, int]) -> int:
+        """Current generation of key; read before querying the rows to put()."""
+        with self._lock:
+            return self._generations.get(key, 0)
+
+    def put(self, key: Tuple[str, int], generation: int, rows: Optional[list]) -> None:
+        """Store rows unless key was invalidated since generation was read."""
+        with self._lock:
+            if self._generations.get(key, 0) != generation:
+                return
+            self._entries[key] = (time.monotonic(), None if rows is None else list(rows))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Tuple[str, int]) -> None:
+        """Drop key and reject puts of rows loaded before this call."""
+        with self._lock:
+            self._entries.pop(key, None)
+            self._generations[key] = self._generations.get(key, 0) + 1
+
+
+_skills_cache = _UserRowsCache()
+_training_cache = _UserRowsCache()
+
+
 class DataManager:
     @contextmanager
     def get_session(self):
@@ -236,6 +292,15 @@ class DataManager:
             self.data_model = DataModel()
             self.data_model.create_db_and_tables()
 
+    def _cache_key(self, user_id: int) -> Tuple[str, int]:
+        """Key of a user's rows in the process-wide skill/training caches."""
+        return self.data_model.sqlite_url, user_id
+
+    def _invalidate_user_caches(self, user_id: int) -> None:
+        """Drop a user's cached skills and trainings after a committed write."""
+        _skills_cache.invalidate(self._cache_key(user_id))
+        _training_cache.invalidate(self._cache_key(user_id))
+
     # User Management Methods
 
     def add_user(self, new_user: User) -> Optional[User]:
@@ -343,6 +408,7 @@ class DataManager:
 
                 session.delete(db_user)
                 session.commit()
+                self._invalidate_user_caches(user_id)
                 return True
             except Exception as e:
                 session.rollback()
@@ -528,7 +594,18 @@ class DataManager:
                 return []
 
     def get_skills_for_user(self, user_id: int) -> Optional[List[Skill]]:
-        """Get all skills for a user."""
+        """Get all skills for a user (cached until the user's skills change or the TTL runs out)."""
+        key = self._cache_key(user_id)
+        hit, skills = _skills_cache.get(key)
+        if hit:
+            return skills
+        generation = _skills_cache.generation(key)
+        skills = self._load_skills_for_user(user_id)
+        _skills_cache.put(key, generation, skills)
+        return skills
+
+    def _load_skills_for_user(self, user_id: int) -> Optional[List[Skill]]:
+        """Query all skills for a user."""
         skill_ids = self.get_skill_ids_for_user(user_id)
         if skill_ids:
             with self.get_session() as session:
@@ -558,6 +635,26 @@ class DataManager:
             else:
                 return 0  # Default to 0 if no skill level found
 
+    def get_skilllevels_for_user(self, user_id: int, skill_ids: List[int]) -> Dict[int, int]:
+        """Get skill levels for several skills of a user in one query.
+
+        Args:
+            user_id: ID of the user
+            skill_ids: IDs of the skills to look up
+
+        Returns:
+            Dict mapping skill_id to level; skills without a level are omitted
+        """
+        if not skill_ids:
+            return {}
+        with self.get_session() as session:
+            rows = (
+                session.query(UserSkill.skill_id, UserSkill.level)
+                .filter(UserSkill.user_id == user_id, UserSkill.skill_id.in_(skill_ids))
+                .all()
+            )
+            return {skill_id: level for skill_id, level in rows if level is not None}
+
     def set_skill_for_user(
         self, user_id: int, skill: Skill, level=0
     ) -> Optional[Skill]:
@@ -574,6 +671,7 @@ class DataManager:
                 try:
                     existing_user_skill.level = level
                     session.commit()
+                    _skills_cache.invalidate(self._cache_key(user_id))
                     return skill
                 except Exception as e:
                     print(f"Error updating skill for user: {e}")
@@ -584,6 +682,7 @@ class DataManager:
                 new_skill = self.get_or_create_skill(skill.skill_name)
                 session.add(UserSkill(user_id=user_id, skill_id=new_skill.id, level=level))
                 session.commit()
+                _skills_cache.invalidate(self._cache_key(user_id))
                 return new_skill
             except Exception as e:
                 print(f"Error setting skill for user: {e}")
@@ -622,6 +721,7 @@ class DataManager:
                 try:
                     session.add(userskill)
                     session.commit()
+                    _skills_cache.invalidate(self._cache_key(user_id))
                 except Exception as e:
                     print(f"Error adding userskill: {e}")
                     session.rollback()
@@ -641,6 +741,7 @@ class DataManager:
             try:
                 session.add(training)
                 session.commit()
+                _training_cache.invalidate(self._cache_key(training.user_id))
                 session.refresh(training)
 
                 return training
@@ -652,18 +753,29 @@ class DataManager:
     def get_training_for_user(self, user_id: int) -> List[Training]:
         """Get training data for a user.
 
+        Results are cached per user until add_training/update_training_status
+        touch that user's trainings (through any DataManager on the same
+        database) or the cache TTL runs out.
+
         Args:
             user_id: User ID to get training for
 
         Returns:
             List of Training objects
         """
+        key = self._cache_key(user_id)
+        hit, trainings = _training_cache.get(key)
+        if hit:
+            return trainings
+        generation = _training_cache.generation(key)
         with self.get_session() as session:
             try:
-                return session.query(Training).filter(Training.user_id == user_id).all()
+                trainings = session.query(Training).filter(Training.user_id == user_id).all()
             except Exception as e:
                 print(f"Error getting training data for user: {e}")
                 return []
+        _training_cache.put(key, generation, trainings)
+        return trainings
 
     def get_training_for_skill(self, skill_id: int) -> List[Training]:
         """Get training data for a skill.
@@ -708,6 +820,7 @@ class DataManager:
 
                 setattr(training, "status", new_status)
                 session.commit()
+                _training_cache.invalidate(self._cache_key(user_id))
                 session.refresh(training)
                 return training
             except Exception as e:
@@ -1,4 +1,6 @@
 import datetime
+import threading
+import traceback
 from os import path
 from pathlib import Path
 from typing import Generator, Optional, List, Dict, Any
@@ -16,7 +18,10 @@ from sqlalchemy import (
     text,
     Text,
     Boolean,
+    event,
 )
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
 from sqlalchemy.orm import relationship, DeclarativeBase, Mapped, mapped_column, sessionmaker, Session
 
 # Define Base for SQLAlchemy ORM first
@@ -463,6 +468,74 @@ class RoomInvite(Base):
         return f"<RoomInvite(id={self.id}, room_id={self.room_id}, invitee_id={self.invitee_id}, status={self.status})>"
 
 
+# Server-style SQLite tuning applied to every new DBAPI connection.
+# WAL lets readers proceed while a writer is active, busy_timeout makes
+# writers wait for the lock instead of failing with SQLITE_BUSY.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+def tune_connection(dbapi_connection) -> None:
+    """Apply the shared SQLite PRAGMAs to a raw DBAPI connection.
+    
+    Works for both sqlite3 connections opened by hand (migrations) and the
+    connections SQLAlchemy hands to the ``connect`` event.
+    
+    Args:
+        dbapi_connection: An open sqlite3 connection
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+# One engine (and connection pool) per database file for the whole process.
+# DataManager is constructed per request in many places; without this each
+# instance would open its own pool and re-run the connect PRAGMAs.
+_engines: Dict[str, Engine] = {}
+_engines_lock = threading.Lock()
+
+
+def get_engine(sqlite_url: str) -> Engine:
+    """Get the shared, pooled engine for a SQLite URL, creating it on first use.
+    
+    Args:
+        sqlite_url: SQLAlchemy URL of the SQLite database
+        
+    Returns:
+        Engine: Process-wide engine with tuned connections
+    """
+    engine = _engines.get(sqlite_url)
+    if engine is not None:
+        return engine
+    
+    with _engines_lock:
+        engine = _engines.get(sqlite_url)
+        if engine is None:
+            engine = create_engine(
+                sqlite_url,
+                echo=False,
+                future=True,
+                poolclass=QueuePool,
+                pool_size=10,
+                max_overflow=20,
+                pool_pre_ping=True,
+                connect_args={"check_same_thread": False}
+            )
+            event.listen(engine, "connect", lambda conn, _record: tune_connection(conn))
+            _engines[sqlite_url] = engine
+    return engine
+
+
 class DataModel:
     """
     Database management class for the application.
@@ -476,12 +549,7 @@ class DataModel:
         """
         self.sqlite_file_name = sqlite_file_name
         self.sqlite_url = f"sqlite:///{self.sqlite_file_name}"
-        self.engine = create_engine(
-            self.sqlite_url, 
-            echo=False, 
-            future=True,
-            connect_args={"check_same_thread": False}
-        )
+        self.engine = get_engine(self.sqlite_url)
         self.SessionLocal = sessionmaker(
             autocommit=False, 
             autoflush=False, 
@@ -602,7 +670,6 @@ class DataModel:
         except Exception as e:
             db.rollback()
             print(f"Error setting user preference: {e}")
-            import traceback
             traceback.print_exc()
             return False
         finally:
@@ -35,7 +35,12 @@ class LifeEventModel(Base):
         super().__init__(**kwargs)
 
 class LifeEventManager:
-    """Manager for user life events."""
+    """
+    Manager for user life events.
+    
+    Every operation opens and closes its own Session (as DataManager does),
+    so one manager can be shared and called from several threads.
+    """
     
     def __init__(self, data_manager):
         """Initialize with a DataManager or DataModel instance."""
@@ -45,7 +50,6 @@ class LifeEventManager:
             self.data_model = data_manager.data_model
         else:
             self.data_model = data_manager
-        self.db = next(self.data_model.get_db())
     
     def add_event(self, event_data: Dict[str, Any]) -> LifeEvent:
         """Add a new life event."""
@@ -59,23 +63,25 @@ class LifeEventManager:
         if 'end_date' in event_data and event_data['end_date'] and isinstance(event_data['end_date'], str):
             event_data['end_date'] = datetime.fromisoformat(event_data['end_date'])
         
-        try:
-            event = LifeEventModel(**event_data)
-            self.db.add(event)
-            self.db.commit()
-            self.db.refresh(event)
-            return self._to_pydantic(event)
-        except Exception as e:
-            self.db.rollback()
-            raise
+        with self.data_model.SessionLocal() as db:
+            try:
+                event = LifeEventModel(**event_data)
+                db.add(event)
+                db.commit()
+                db.refresh(event)
+                return self._to_pydantic(event)
+            except Exception:
+                db.rollback()
+                raise
     
     def get_event(self, event_id: int, user_id: int) -> Optional[LifeEvent]:
         """Get a specific event by ID."""
-        event = self.db.query(LifeEventModel).filter(
-            LifeEventModel.id == event_id,
-            LifeEventModel.user_id == user_id
-        ).first()
-        return self._to_pydantic(event) if event else None
+        with self.data_model.SessionLocal() as db:
+            event = db.query(LifeEventModel).filter(
+                LifeEventModel.id == event_id,
+                LifeEventModel.user_id == user_id
+            ).first()
+            return self._to_pydantic(event) if event else None
     
     def get_user_events(
         self, 
@@ -85,18 +91,19 @@ class LifeEventManager:
         offset: int = 0
     ) -> List[LifeEvent]:
         """Get events for a user with optional filtering."""
-        query = self.db.query(LifeEventModel).filter(
-            LifeEventModel.user_id == user_id
-        )
-        
-        if event_type:
-            query = query.filter(LifeEventModel.event_type == event_type)
+        with self.data_model.SessionLocal() as db:
+            query = db.query(LifeEventModel).filter(
+                LifeEventModel.user_id == user_id
+            )
             
-        events = query.order_by(
-            LifeEventModel.start_date.desc()
-        ).offset(offset).limit(limit).all()
-        
-        return [self._to_pydantic(e) for e in events]
+            if event_type:
+                query = query.filter(LifeEventModel.event_type == event_type)
+                
+            events = query.order_by(
+                LifeEventModel.start_date.desc()
+            ).offset(offset).limit(limit).all()
+            
+            return [self._to_pydantic(e) for e in events]
     
     def update_event(
         self, 
@@ -105,35 +112,37 @@ class LifeEventManager:
         update_data: Dict[str, Any]
     ) -> Optional[LifeEvent]:
         """Update an existing event."""
-        event = self.db.query(LifeEventModel).filter(
-            LifeEventModel.id == event_id,
-            LifeEventModel.user_id == user_id
-        ).first()
-        
-        if not event:
-            return None
-            
-        for key, value in update_data.items():
-            setattr(event, key, value)
+        with self.data_model.SessionLocal() as db:
+            event = db.query(LifeEventModel).filter(
+                LifeEventModel.id == event_id,
+                LifeEventModel.user_id == user_id
+            ).first()
             
-        event.updated_at = datetime.utcnow()
-        self.db.commit()
-        self.db.refresh(event)
-        return self._to_pydantic(event)
+            if not event:
+                return None
+                
+            for key, value in update_data.items():
+                setattr(event, key, value)
+                
+            event.updated_at = datetime.utcnow()
+            db.commit()
+            db.refresh(event)
+            return self._to_pydantic(event)
     
     def delete_event(self, event_id: int, user_id: int) -> bool:
         """Delete an event."""
-        event = self.db.query(LifeEventModel).filter(
-            LifeEventModel.id == event_id,
-            LifeEventModel.user_id == user_id
-        ).first()
-        
-        if not event:
-            return False
+        with self.data_model.SessionLocal() as db:
+            event = db.query(LifeEventModel).filter(
+                LifeEventModel.id == event_id,
+                LifeEventModel.user_id == user_id
+            ).first()
             
-        self.db.delete(event)
-        self.db.commit()
-        return True
+            if not event:
+                return False
+                
+            db.delete(event)
+            db.commit()
+            return True
     
     def get_timeline(self, user_id: int) -> Dict[str, List[LifeEvent]]:
         """Get a timeline of events grouped by year."""
@@ -4,6 +4,8 @@ Supports: OpenAI, Gemini, Claude, LM Studio (local), and more
 """
 
 import os
+import threading
+from collections import OrderedDict
 from typing import Optional, Dict, Any, Literal
 from dotenv import load_dotenv
 from langchain.chat_models import init_chat_model
@@ -35,6 +37,15 @@ except ImportError:
 
 load_dotenv()
 
+# One LLM instance per distinct configuration. Chat models are safe to share
+# across requests, and reusing them keeps their HTTP connection pools warm
+# (and the bound-tools cache in ai_chatagent keyed on the instance hitting).
+# The key includes client-controlled values (model, endpoint, temperature),
+# so the cache is an LRU capped at _LLM_CACHE_MAXSIZE instances.
+_LLM_CACHE_MAXSIZE = 32
+_LLM_CACHE: "OrderedDict[tuple, Any]" = OrderedDict()
+_LLM_CACHE_LOCK = threading.Lock()
+
 
 class LLMProvider:
     """Enum-like class for LLM providers"""
@@ -116,6 +127,11 @@ class LLMManager:
         """
         Get an LLM instance based on provider and configuration.
         
+        Instances are cached per configuration, so repeated calls with the
+        same arguments (e.g. one per chat request) return the same object.
+        The least recently used instance is dropped once more than
+        _LLM_CACHE_MAXSIZE configurations are cached.
+        
         Args:
             provider: LLM provider (openai, gemini, claude, lm_studio, ollama)
             model: Model name (provider-specific)
@@ -128,7 +144,40 @@ class LLMManager:
         Returns:
             Configured LLM instance
         """
+        try:
+            key = (provider, model, temperature, max_tokens, api_key, base_url,
+                   tuple(sorted(kwargs.items())))
+            hash(key)
+        except TypeError:
+            # Unhashable provider-specific kwargs: build an uncached instance
+            return LLMManager._create_llm(
+                provider, model, temperature, max_tokens, api_key, base_url, **kwargs
+            )
         
+        with _LLM_CACHE_LOCK:
+            llm = _LLM_CACHE.get(key)
+            if llm is None:
+                llm = LLMManager._create_llm(
+                    provider, model, temperature, max_tokens, api_key, base_url, **kwargs
+                )
+                _LLM_CACHE[key] = llm
+                while len(_LLM_CACHE) > _LLM_CACHE_MAXSIZE:
+                    _LLM_CACHE.popitem(last=False)
+            else:
+                _LLM_CACHE.move_to_end(key)
+        return llm
+    
+    @staticmethod
+    def _create_llm(
+        provider: str,
+        model: Optional[str],
+        temperature: float,
+        max_tokens: Optional[int],
+        api_key: Optional[str],
+        base_url: Optional[str],
+        **kwargs
+    ):
+        """Build a new LLM instance (uncached, see get_llm)"""
         if provider == LLMProvider.OPENAI:
             return LLMManager._get_openai_llm(model, temperature, max_tokens, api_key, **kwargs)
         
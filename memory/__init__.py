@@ -8,6 +8,7 @@ Key Components:
 - UserMemoryEncryptor: Handles user-specific encryption/decryption
 - SecureMemoryManager: Manages encrypted conversation storage
 - UserAgent: User-specific AI agent with isolated memory access
+- RollingHistory: Recent-message window plus summary of older turns
 
 Author: Socializer Development Team
 Date: 2024-11-12
@@ -16,11 +17,14 @@ Date: 2024-11-12
 from memory.memory_encryptor import UserMemoryEncryptor
 from memory.secure_memory_manager import SecureMemoryManager
 from memory.user_agent import UserAgent
+from memory.rolling_history import RollingHistory, extractive_summary
 
 __all__ = [
     'UserMemoryEncryptor',
     'SecureMemoryManager', 
-    'UserAgent'
+    'UserAgent',
+    'RollingHistory',
+    'extractive_summary'
 ]
 
 __version__ = '1.0.0'
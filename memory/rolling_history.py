@@ -0,0 +1,139 @@
+"""
+Rolling conversation history with a summary of evicted turns.
+
+Keeps the most recent messages verbatim in a bounded FIFO queue and folds
+older messages into a compact running summary instead of dropping them, so
+facts from early in a long conversation (the user's name, stated
+preferences) stay in context without re-reading the full history.
+
+Author: Socializer Development Team
+Date: 2024-11-12
+"""
+
+import logging
+from collections import deque
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# Signature: (previous_summary, evicted_messages) -> new_summary
+Summarizer = Callable[[str, List[Dict[str, Any]]], str]
+
+
+def extractive_summary(
+    previous: str,
+    messages: List[Dict[str, Any]],
+    max_line_chars: int = 160,
+    max_chars: int = 2000
+) -> str:
+    """
+    Fold evicted messages into the summary without an LLM call.
+
+    Each message becomes one "role: content" line (truncated); when the
+    summary exceeds max_chars the oldest lines are dropped first.
+
+    Args:
+        previous: Summary so far (may be empty)
+        messages: Messages evicted from the recent-history queue
+        max_line_chars: Maximum characters kept per message
+        max_chars: Maximum length of the resulting summary
+
+    Returns:
+        str: Updated summary
+    """
+    lines = previous.splitlines() if previous else []
+    for msg in messages:
+        content = " ".join(str(msg.get("content", "")).split())
+        if content:
+            lines.append(f"{msg.get('role', 'user')}: {content[:max_line_chars]}")
+
+    summary = "\n".join(lines)
+    while len(summary) > max_chars and len(lines) > 1:
+        lines.pop(0)
+        summary = "\n".join(lines)
+    return summary[-max_chars:]
+
+
+class RollingHistory:
+    """
+    FIFO queue of recent messages plus a summary of everything older.
+
+    Appending to a full queue moves the oldest message into a pending
+    batch; once batch_size messages are pending they are folded into
+    the summary in one summarizer call.
+
+    Attributes:
+        summary: Running summary of evicted messages
+        maxlen: Number of recent messages kept verbatim
+
+    Example:
+        >>> history = RollingHistory(maxlen=2, batch_size=1)
+        >>> for text in ("hi", "my name is Ana", "how are you?"):
+        ...     history.append({"role": "user", "content": text})
+        >>> history.summary
+        'user: hi'
+        >>> [m["content"] for m in history]
+        ['my name is Ana', 'how are you?']
+    """
+
+    def __init__(
+        self,
+        messages: Optional[List[Dict[str, Any]]] = None,
+        maxlen: int = 20,
+        summary: str = "",
+        summarizer: Summarizer = extractive_summary,
+        batch_size: int = 10,
+        on_summary: Optional[Callable[[str], None]] = None
+    ):
+        """
+        Initialize the rolling history.
+
+        Args:
+            messages: Initial messages; only the last maxlen are kept
+            maxlen: Number of recent messages kept verbatim
+            summary: Previously persisted summary to continue from
+            summarizer: Function folding evicted messages into the summary
+            batch_size: Evicted messages collected before summarizing
+            on_summary: Called with the new summary after each fold
+        """
+        self.maxlen = maxlen
+        self.summary = summary or ""
+        self._messages: deque = deque(maxlen=maxlen)
+        self._evicted: List[Dict[str, Any]] = []
+        self._summarizer = summarizer
+        self._batch_size = batch_size
+        self._on_summary = on_summary
+        for message in (messages or [])[-maxlen:]:
+            self._messages.append(message)
+
+    def append(self, message: Dict[str, Any]) -> None:
+        """
+        Add a message, evicting (and eventually summarizing) the oldest.
+
+        Args:
+            message: Message dictionary with role/content
+        """
+        if len(self._messages) == self.maxlen:
+            self._evicted.append(self._messages[0])
+        self._messages.append(message)
+
+        if len(self._evicted) >= self._batch_size:
+            self._fold()
+
+    def _fold(self) -> None:
+        """Merge the pending evicted messages into the summary."""
+        evicted, self._evicted = self._evicted, []
+        try:
+            self.summary = self._summarizer(self.summary, evicted)
+        except Exception as e:
+            logger.warning("History summarization failed, using extractive fallback: %s", e)
+            self.summary = extractive_summary(self.summary, evicted)
+        if self._on_summary:
+            self._on_summary(self.summary)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self._messages)
+
+    def __len__(self) -> int:
+        return len(self._messages)
@@ -296,6 +296,24 @@ class SecureMemoryManager:
         
         return messages[-count:] if len(messages) > count else messages
     
+    def get_history_summary(self) -> str:
+        """
+        Get the summary of conversation turns older than the recent window.
+        
+        Returns:
+            str: Summary text (empty if none yet)
+        """
+        return self._current_memory.get("history_summary", "")
+    
+    def set_history_summary(self, summary: str) -> None:
+        """
+        Store the history summary; persisted (encrypted) on the next save.
+        
+        Args:
+            summary: Summary text
+        """
+        self._current_memory["history_summary"] = summary
+    
     def get_memory_stats(self) -> Dict[str, Any]:
         """
         Get statistics about the current memory.
@@ -245,6 +245,14 @@ class UserAgent:
         stats["buffer_size"] = len(self._conversation_buffer)
         return stats
     
+    def get_history_summary(self) -> str:
+        """Get the encrypted-memory summary of older conversation turns."""
+        return self._memory_manager.get_history_summary()
+    
+    def set_history_summary(self, summary: str) -> None:
+        """Store the summary of older conversation turns (saved with memory)."""
+        self._memory_manager.set_history_summary(summary)
+    
     def clear_conversation_buffer(self) -> None:
         """Clear the temporary conversation buffer."""
         self._conversation_buffer = []
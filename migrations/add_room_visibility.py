@@ -14,6 +14,22 @@ Date: 2025-10-15
 
 import sqlite3
 import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from datamanager.data_model import tune_connection
+
+
+def _column_exists(cursor, table: str, column: str) -> bool:
+    """Check for a column inside SQLite instead of scanning table_info in Python."""
+    cursor.execute(
+        f"SELECT 1 FROM pragma_table_info('{table}') WHERE name = ? LIMIT 1",
+        (column,)
+    )
+    return cursor.fetchone() is not None
 
 
 def run_migration():
@@ -31,17 +47,19 @@ def run_migration():
     try:
         # Connect to database
         print(f"[TRACE] Connecting to database: {db_path}")
-        conn = sqlite3.connect(db_path)
+        conn = sqlite3.connect(db_path, isolation_level=None)
+        tune_connection(conn)
         cursor = conn.cursor()
         
+        # Take the write lock up front so the check and the ALTER are atomic
+        # and a concurrent writer makes us wait (busy_timeout) instead of failing
+        cursor.execute("BEGIN IMMEDIATE")
+        
         # Check if column already exists
         print("[TRACE] Checking if is_public column exists...")
-        cursor.execute("PRAGMA table_info(chat_rooms)")
-        columns = cursor.fetchall()
-        column_names = [col[1] for col in columns]
-        
-        if 'is_public' in column_names:
+        if _column_exists(cursor, "chat_rooms", "is_public"):
             print("[EVAL] Column 'is_public' already exists - skipping migration")
+            conn.rollback()
             conn.close()
             return True
         
@@ -53,11 +71,7 @@ def run_migration():
         """)
         
         # EVALUATION: Verify column was added
-        cursor.execute("PRAGMA table_info(chat_rooms)")
-        columns = cursor.fetchall()
-        column_names = [col[1] for col in columns]
-        
-        if 'is_public' not in column_names:
+        if not _column_exists(cursor, "chat_rooms", "is_public"):
             raise Exception("Column was not added successfully")
         
         print("[EVAL] Column added successfully")
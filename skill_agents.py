@@ -239,9 +239,9 @@ class SkillEvaluationOrchestrator:
     
     def _research_skills(self, user_id: int, messages: List[Dict], dm: DataManager) -> Dict[str, Any]:
         """Research skills using web search."""
-        from langchain_tavily import TavilySearch
+        from tools.search import get_tavily_search
         
-        search = TavilySearch(max_results=3)
+        search = get_tavily_search(max_results=3)
         combined_text = " ".join(
             msg['content'] 
             for msg in messages[-5:]  # Last 5 messages for context
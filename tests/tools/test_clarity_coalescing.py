@@ -0,0 +1,89 @@
+"""
+Tests for ClarifyCommunicationTool Request Coalescing
+
+LOCATION: tests/tools/test_clarity_coalescing.py
+PURPOSE: Concurrent identical clarifications share one LLM call, across tool
+    instances, and a cancelled caller does not fail the others
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from tools.communication import clarity_tool
+from tools.communication.clarity_tool import ClarifyCommunicationTool
+
+
+class SlowLLM:
+    """Async LLM stub that counts calls and answers after a short delay."""
+
+    model_name = "stub-model"
+
+    def __init__(self, fail: bool = False):
+        self.calls = 0
+        self.fail = fail
+
+    async def ainvoke(self, prompt):
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        if self.fail:
+            raise RuntimeError("LLM unavailable")
+        return SimpleNamespace(content="EMPATHY_STATUS: OK")
+
+
+@pytest.fixture(autouse=True)
+def no_response_cache(monkeypatch):
+    """Keep the persistent response cache out of these tests."""
+    monkeypatch.setattr(clarity_tool, "get_llm_cache", lambda: None)
+
+
+def _clarify(tool: ClarifyCommunicationTool, text: str = "hello"):
+    """Coroutine for one clarification of text."""
+    return tool._atranslate_and_clarify(text, None, "English", None, False)
+
+
+def test_identical_calls_from_different_tools_share_one_llm_call():
+    """Two agents' tools asking the same question at once make one call."""
+    llm = SlowLLM()
+    first, second = ClarifyCommunicationTool(llm=llm), ClarifyCommunicationTool(llm=llm)
+
+    async def main():
+        return await asyncio.gather(_clarify(first), _clarify(second))
+
+    results = asyncio.run(main())
+    assert llm.calls == 1
+    assert results[0] == results[1]
+
+
+def test_cancelled_first_caller_does_not_fail_followers():
+    """Cancelling the caller that started the call leaves followers unaffected."""
+    llm = SlowLLM()
+    tool = ClarifyCommunicationTool(llm=llm)
+
+    async def main():
+        leader = asyncio.ensure_future(_clarify(tool))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(_clarify(tool))
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await follower
+
+    assert asyncio.run(main())["coaching_analysis"] == "EMPATHY_STATUS: OK"
+    assert llm.calls == 1
+
+
+def test_failure_reaches_every_caller_and_is_not_kept():
+    """An LLM error is raised to all callers and the next call retries."""
+    llm = SlowLLM(fail=True)
+    tool = ClarifyCommunicationTool(llm=llm)
+
+    async def main():
+        results = await asyncio.gather(_clarify(tool), _clarify(tool), return_exceptions=True)
+        llm.fail = False
+        return results, await _clarify(tool)
+
+    results, retried = asyncio.run(main())
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert llm.calls == 2
+    assert retried["coaching_analysis"] == "EMPATHY_STATUS: OK"
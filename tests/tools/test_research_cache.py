@@ -0,0 +1,92 @@
+"""
+Tests for SkillEvaluator Web Research Caching
+
+LOCATION: tests/tools/test_research_cache.py
+PURPOSE: Concurrent misses share one fetch per cultural context, different
+    contexts fetch in parallel, and the cache stays bounded
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from datamanager.data_manager import DataManager
+from tools.skills import evaluator_tool
+from tools.skills.evaluator_tool import SkillEvaluator
+
+
+class SlowSearch:
+    """Tavily stub that records queries and answers after a delay."""
+
+    def __init__(self):
+        self.queries = []
+        self._lock = threading.Lock()
+
+    def invoke(self, query):
+        with self._lock:
+            self.queries.append(query)
+        time.sleep(0.2)
+        if "failing" in query:
+            raise RuntimeError("search unavailable")
+        return f"results for {query}"
+
+
+@pytest.fixture
+def search(monkeypatch):
+    """Empty research cache and a stubbed search tool."""
+    stub = SlowSearch()
+    monkeypatch.setattr(evaluator_tool, "_RESEARCH_CACHE", {})
+    monkeypatch.setattr(evaluator_tool, "get_tavily_search", lambda max_results=None: stub)
+    return stub
+
+
+@pytest.fixture
+def evaluator(tmp_path):
+    """SkillEvaluator on a throwaway database."""
+    return SkillEvaluator(DataManager(str(tmp_path / "research.db")))
+
+
+def _fetch_all(evaluator, contexts):
+    """Fetch research for all contexts concurrently; returns (results, seconds)."""
+    start = time.monotonic()
+    with ThreadPoolExecutor(len(contexts)) as pool:
+        results = list(pool.map(evaluator._fetch_research, contexts))
+    return results, time.monotonic() - start
+
+
+def test_same_context_is_fetched_once(search, evaluator):
+    """Concurrent misses differing only in case/whitespace share one fetch."""
+    results, _ = _fetch_all(evaluator, ["Western", " western ", "WESTERN"])
+
+    assert search.queries == ["latest western empathy social skills research 2024 2025"]
+    assert all(r == results[0] for r in results)
+    assert evaluator_tool._RESEARCH_INFLIGHT == {}
+
+
+def test_different_contexts_fetch_in_parallel(search, evaluator):
+    """A miss for one context does not wait for another context's fetch."""
+    _, elapsed = _fetch_all(evaluator, ["Western", "Eastern", "Nordic", "Latin"])
+
+    assert len(search.queries) == 4
+    assert elapsed < 0.6
+
+
+def test_failed_fetch_is_shared_and_not_cached(search, evaluator):
+    """Waiters of a failed fetch get None and the next call retries."""
+    results, _ = _fetch_all(evaluator, ["failing", "Failing"])
+
+    assert results == [None, None]
+    assert evaluator._fetch_research("failing") is None
+    assert len(search.queries) == 2
+
+
+def test_cache_is_bounded(search, evaluator, monkeypatch):
+    """The oldest context is evicted once the cache is full."""
+    monkeypatch.setattr(evaluator_tool, "_RESEARCH_CACHE_MAXSIZE", 2)
+    monkeypatch.setattr(SlowSearch, "invoke", lambda self, query: query)
+    for context in ("a", "b", "c"):
+        evaluator._fetch_research(context)
+
+    assert list(evaluator_tool._RESEARCH_CACHE) == ["b", "c"]
@@ -0,0 +1,114 @@
+"""
+Tests for FastArgsSchemaMixin
+
+LOCATION: tests/tools/test_schema_input.py
+PURPOSE: The mixin overrides BaseTool._parse_input (a private LangChain
+    method); these tests pin its output to LangChain's for every tool that
+    uses it, so a langchain-core change fails here instead of silently
+    changing tool behavior.
+"""
+
+import pytest
+from langchain_core.tools import BaseTool
+from pydantic import ValidationError
+
+from datamanager.data_manager import DataManager
+from tools.events.life_event_tool import LifeEventTool
+from tools.schema_input import FastArgsSchemaMixin
+from tools.search.tavily_search_tool import TavilySearchTool
+from tools.skills.evaluator_tool import SkillEvaluator
+from tools.user.preference_tool import UserPreferenceTool
+
+
+@pytest.fixture(scope="module")
+def data_manager(tmp_path_factory):
+    """DataManager on a throwaway SQLite file."""
+    return DataManager(str(tmp_path_factory.mktemp("schema_input") / "test.db"))
+
+
+@pytest.fixture(scope="module")
+def tools(data_manager):
+    """One instance of every tool using the mixin, by name."""
+    return {
+        "user_preference": UserPreferenceTool(data_manager),
+        "skill_evaluator": SkillEvaluator(data_manager),
+        "life_event": LifeEventTool(data_manager),
+        "tavily_search": TavilySearchTool(search_tool=None),
+    }
+
+
+# Per tool: input with only the required fields (so defaults are filled in),
+# input with optional fields set, and input missing a required field
+CASES = {
+    "user_preference": (
+        {"action": "get", "user_id": 1},
+        {"action": "set", "user_id": 1, "preference_type": "personal_info",
+         "preference_key": "name", "preference_value": "Ana", "confidence": 0.5},
+        {"action": "get"},
+    ),
+    "skill_evaluator": (
+        {"user_id": 1},
+        {"user_id": 1, "messages": ["hi", "I understand"], "cultural_context": "Eastern",
+         "use_web_research": False},
+        {"message": "hi"},
+    ),
+    "life_event": (
+        {"action": "list", "user_id": 1},
+        {"action": "add", "user_id": 1, "event_type": "other", "title": "Moved",
+         "start_date": "2024-05-01", "end_date": "2024-05-02 morning", "impact_level": 7},
+        {"user_id": 1},
+    ),
+    "tavily_search": (
+        {"query": "weather in Paris"},
+        {"query": "weather in Paris"},
+        {},
+    ),
+}
+
+
+def _outcome(parse, tool_input):
+    """Result of a parse, or the exception type and error locations it raised."""
+    try:
+        return parse(dict(tool_input) if isinstance(tool_input, dict) else tool_input, None)
+    except ValidationError as e:
+        return ValidationError, sorted(err["loc"] for err in e.errors())
+
+
+def _compare(tool, tool_input):
+    """Assert the mixin and BaseTool._parse_input agree on tool_input."""
+    expected = _outcome(lambda i, c: BaseTool._parse_input(tool, i, c), tool_input)
+    assert _outcome(tool._parse_input, tool_input) == expected
+    return expected
+
+
+def test_every_tool_uses_the_mixin(tools):
+    """The comparison below covers the tools that actually use the override."""
+    for tool in tools.values():
+        assert isinstance(tool, FastArgsSchemaMixin)
+
+
+@pytest.mark.parametrize("name", CASES)
+def test_defaults_filled_in_like_langchain(tools, name):
+    """Only required fields given: defaults are filled in identically."""
+    result = _compare(tools[name], CASES[name][0])
+    assert set(result) == set(tools[name].args_schema.model_fields)
+
+
+@pytest.mark.parametrize("name", CASES)
+def test_optional_fields_validated_like_langchain(tools, name):
+    """Optional fields given: values are validated and coerced identically."""
+    _compare(tools[name], CASES[name][1])
+
+
+@pytest.mark.parametrize("name", CASES)
+def test_missing_required_field_fails_like_langchain(tools, name):
+    """A missing required field raises the same validation errors."""
+    result = _compare(tools[name], CASES[name][2])
+    assert result[0] is ValidationError
+
+
+@pytest.mark.parametrize("name", CASES)
+@pytest.mark.parametrize("tool_input", ["some text", "42"])
+def test_string_input_like_langchain(tools, name, tool_input):
+    """String input is returned (or rejected) exactly as LangChain does."""
+    _compare(tools[name], tool_input)
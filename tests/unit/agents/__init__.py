@@ -0,0 +1,12 @@
+"""
+Tests for Chat Agent Components
+
+LOCATION: tests/unit/agents/
+PURPOSE: Unit tests for AiChatagent helpers and app/agents handlers
+
+Test Modules:
+    - test_bound_llm_cache: Shared bind_tools() cache
+    - test_conversation_writer: Background ChatSession turn writer
+    - test_history_summary_fence: History summary block of the system prompt
+    - test_tool_handler: Concurrent tool-call execution
+"""
@@ -0,0 +1,69 @@
+"""
+Tests for the Bound-Tools LLM Cache
+
+LOCATION: tests/unit/agents/test_bound_llm_cache.py
+PURPOSE: _bind_tools_cached reuses bindings per LLM, stays bounded, and never
+    returns a binding made for a different LLM
+"""
+
+import collections
+from types import SimpleNamespace
+
+import pytest
+
+import ai_chatagent
+from ai_chatagent import _bind_tools_cached
+
+
+class StubLLM:
+    """LLM stub whose bind_tools returns a fresh marker object."""
+
+    def __init__(self):
+        self.bind_calls = 0
+
+    def bind_tools(self, tool_list):
+        self.bind_calls += 1
+        return SimpleNamespace(llm=self, tools=list(tool_list))
+
+
+TOOLS = [SimpleNamespace(name="user_preference"), SimpleNamespace(name="web_search")]
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch):
+    """Start each test with an empty cache of size 2."""
+    monkeypatch.setattr(ai_chatagent, "_BOUND_LLM_CACHE", collections.OrderedDict())
+    monkeypatch.setattr(ai_chatagent, "_BOUND_LLM_CACHE_MAXSIZE", 2)
+
+
+def test_binding_is_reused_for_the_same_llm():
+    """The same LLM and tool names bind once."""
+    llm = StubLLM()
+    assert _bind_tools_cached(llm, TOOLS) is _bind_tools_cached(llm, TOOLS)
+    assert llm.bind_calls == 1
+
+
+def test_cache_is_capped_least_recently_used_first():
+    """Beyond the cap the binding unused longest is dropped."""
+    first, second, third = StubLLM(), StubLLM(), StubLLM()
+    _bind_tools_cached(first, TOOLS)
+    _bind_tools_cached(second, TOOLS)
+    _bind_tools_cached(first, TOOLS)  # refresh "first"
+    _bind_tools_cached(third, TOOLS)  # evicts "second"
+
+    assert len(ai_chatagent._BOUND_LLM_CACHE) == 2
+    _bind_tools_cached(first, TOOLS)
+    _bind_tools_cached(second, TOOLS)
+    assert (first.bind_calls, second.bind_calls) == (1, 2)
+
+
+def test_reused_id_does_not_return_another_llms_binding():
+    """An entry whose stored LLM is not the caller's is rebound, not returned."""
+    llm, other = StubLLM(), StubLLM()
+    key = (id(llm), tuple((type(t), t.name) for t in TOOLS))
+    ai_chatagent._BOUND_LLM_CACHE[key] = (other, other.bind_tools(TOOLS))
+
+    bound = _bind_tools_cached(llm, TOOLS)
+
+    assert bound.llm is llm
+    assert ai_chatagent._BOUND_LLM_CACHE[key][0] is llm
@@ -0,0 +1,75 @@
+"""
+Tests for the Background Conversation Writer
+
+LOCATION: tests/unit/agents/test_conversation_writer.py
+PURPOSE: ChatSession turns queued with _queue_session_turn are saved in
+    batches, one save_messages call per user with messages in order, and a
+    failing save does not stop the writer thread
+"""
+
+import threading
+
+import pytest
+
+import ai_chatagent
+from ai_chatagent import _WRITE_QUEUE, _queue_session_turn
+
+
+class RecordingDataManager:
+    """DataManager stub recording save_messages calls; can fail for some users."""
+
+    def __init__(self, failing_users=()):
+        self.saves = []
+        self.failing_users = set(failing_users)
+
+    def save_messages(self, user_id, messages):
+        if user_id in self.failing_users:
+            raise RuntimeError("database is locked")
+        self.saves.append((user_id, messages))
+
+
+@pytest.fixture
+def recording_dm(monkeypatch):
+    """Route the writer's saves to a RecordingDataManager."""
+    _WRITE_QUEUE.join()  # turns queued before the test go to the real dm
+    stub = RecordingDataManager()
+    monkeypatch.setattr(ai_chatagent, "dm", stub)
+    return stub
+
+
+def _writer_alive() -> bool:
+    """Whether the dm-writer daemon thread is running."""
+    return any(t.name == "dm-writer" and t.is_alive() for t in threading.enumerate())
+
+
+def test_turns_are_saved_once_per_user_in_order(recording_dm):
+    """Turns queued together produce one save per user, oldest turn first."""
+    for user_id, n in [(1, 1), (2, 1), (1, 2), (2, 2), (1, 3)]:
+        _queue_session_turn(user_id, f"question {n}", f"answer {n}", "web_search" if n == 2 else None)
+    _WRITE_QUEUE.join()
+
+    by_user = dict(recording_dm.saves)
+    assert sorted(user_id for user_id, _ in recording_dm.saves) == [1, 2]
+    assert [m["content"] for m in by_user[1]] == [
+        "question 1", "answer 1", "question 2", "answer 2", "question 3", "answer 3"
+    ]
+    assert [m["role"] for m in by_user[2]] == ["user", "assistant", "user", "assistant"]
+    assert by_user[2][3]["tools_used"] == ["web_search"]
+
+
+def test_failing_save_does_not_stop_the_writer(recording_dm):
+    """A save error for one user neither drops other users nor kills the thread."""
+    recording_dm.failing_users.add(1)
+    _queue_session_turn(1, "lost question", "lost answer", None)
+    _queue_session_turn(2, "kept question", "kept answer", None)
+    _WRITE_QUEUE.join()
+
+    assert [user_id for user_id, _ in recording_dm.saves] == [2]
+    assert _writer_alive()
+
+    recording_dm.failing_users.clear()
+    _queue_session_turn(1, "later question", "later answer", None)
+    _WRITE_QUEUE.join()
+
+    assert recording_dm.saves[-1][0] == 1
+    assert recording_dm.saves[-1][1][0]["content"] == "later question"
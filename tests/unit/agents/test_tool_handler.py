@@ -0,0 +1,102 @@
+"""
+Tests for ToolHandler Tool-Call Execution
+
+LOCATION: tests/unit/agents/test_tool_handler.py
+PURPOSE: Calls to different tools run concurrently while calls to the same
+    tool run one after another; results keep the order of tool_calls and one
+    failing tool does not lose the others' results
+"""
+
+import threading
+import time
+
+from langchain_core.messages import AIMessage
+
+from app.agents.tool_handler import ToolHandler
+
+
+class StubTool:
+    """Tool stub recording its calls and how many overlapped."""
+
+    def __init__(self, name: str, delay: float = 0.05, fail: bool = False):
+        self.name = name
+        self.delay = delay
+        self.fail = fail
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def invoke(self, tool_args):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            self.calls.append(tool_args["n"])
+        try:
+            time.sleep(self.delay)
+            if self.fail:
+                raise RuntimeError(f"{self.name} is down")
+            return f"{self.name} result {tool_args['n']}"
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def _run(handler: ToolHandler, calls):
+    """Run (tool name, n) calls through handler as one AIMessage."""
+    message = AIMessage(
+        content="",
+        tool_calls=[
+            {"name": name, "args": {"n": n}, "id": f"call_{i}"}
+            for i, (name, n) in enumerate(calls)
+        ],
+    )
+    return handler({"messages": [message]})["messages"]
+
+
+def test_outputs_follow_tool_call_order():
+    """Each ToolMessage sits at the position of its tool call."""
+    handler = ToolHandler([StubTool("alpha"), StubTool("beta", delay=0.01), StubTool("gamma")])
+    calls = [("alpha", 1), ("beta", 1), ("alpha", 2), ("gamma", 1), ("beta", 2)]
+
+    outputs = _run(handler, calls)
+
+    assert [m.tool_call_id for m in outputs] == [f"call_{i}" for i in range(len(calls))]
+    assert [m.name for m in outputs] == [name for name, _ in calls]
+    assert all(f"{name} result {n}" in m.content for m, (name, n) in zip(outputs, calls))
+
+
+def test_calls_to_same_tool_run_one_after_another():
+    """Calls to one tool never overlap and keep their order."""
+    alpha, beta = StubTool("alpha"), StubTool("beta")
+    handler = ToolHandler([alpha, beta])
+
+    _run(handler, [("alpha", 1), ("beta", 1), ("alpha", 2), ("beta", 2), ("alpha", 3)])
+
+    assert alpha.max_active == 1 and beta.max_active == 1
+    assert alpha.calls == [1, 2, 3]
+    assert beta.calls == [1, 2]
+
+
+def test_different_tools_run_concurrently():
+    """A turn calling two slow tools takes about one tool's latency."""
+    handler = ToolHandler([StubTool("alpha", delay=0.2), StubTool("beta", delay=0.2)])
+
+    start = time.monotonic()
+    _run(handler, [("alpha", 1), ("beta", 1)])
+
+    assert time.monotonic() - start < 0.35
+
+
+def test_failing_tool_does_not_lose_other_results():
+    """A raising tool yields an error message; the other calls still return."""
+    handler = ToolHandler([StubTool("alpha"), StubTool("broken", fail=True), StubTool("beta")])
+
+    outputs = _run(handler, [("alpha", 1), ("broken", 1), ("beta", 1), ("broken", 2)])
+
+    assert len(outputs) == 4
+    assert "alpha result 1" in outputs[0].content
+    assert "beta result 1" in outputs[2].content
+    for failed in (outputs[1], outputs[3]):
+        assert "broken is down" in failed.content
+        assert '"error"' in failed.content
@@ -0,0 +1,9 @@
+"""
+Tests for DataManager
+
+LOCATION: tests/unit/db/
+PURPOSE: Unit tests for DataManager behavior not covered by datamanager/test_data_model.py
+
+Test Modules:
+    - test_user_rows_cache: Process-wide skill/training caches
+"""
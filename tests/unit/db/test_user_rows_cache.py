@@ -0,0 +1,146 @@
+"""
+Tests for the Skill/Training Read-Through Caches
+
+LOCATION: tests/unit/db/test_user_rows_cache.py
+PURPOSE: Cached skills and trainings must reflect writes made through any
+    DataManager on the same database, and callers must not be able to
+    change the cache through the lists they get back
+"""
+
+import pytest
+
+from datamanager import data_manager
+from datamanager.data_manager import DataManager, _UserRowsCache
+from datamanager.data_model import Skill, Training, User
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Throwaway SQLite file shared by the DataManagers of one test."""
+    return str(tmp_path / "cache.db")
+
+
+@pytest.fixture
+def user_id(db_path):
+    """ID of a user in the test database."""
+    user = DataManager(db_path).add_user(
+        User(username="cache_user", hashed_password="x", hashed_email="cache@example.com", role="user")
+    )
+    return user.id
+
+
+def _add_training(dm: DataManager, user_id: int, skill_name: str) -> None:
+    """Add a pending training for skill_name through dm."""
+    skill = dm.get_or_create_skill(skill_name)
+    dm.add_training(Training(user_id=user_id, skill_id=skill.id, status="pending"))
+
+
+class TestCrossInstanceInvalidation:
+    """Writes through a second DataManager are seen by the first."""
+
+    def test_skill_written_by_second_manager(self, db_path, user_id):
+        """set_skill_for_user on another instance invalidates cached skills."""
+        reader, writer = DataManager(db_path), DataManager(db_path)
+        assert reader.get_skills_for_user(user_id) is None
+
+        writer.set_skill_for_user(user_id, Skill(skill_name="empathy"), level=3)
+
+        assert [s.skill_name for s in reader.get_skills_for_user(user_id)] == ["empathy"]
+
+    def test_linked_skill_written_by_second_manager(self, db_path, user_id):
+        """link_user_skill on another instance invalidates cached skills."""
+        reader, writer = DataManager(db_path), DataManager(db_path)
+        writer.set_skill_for_user(user_id, Skill(skill_name="empathy"))
+        assert len(reader.get_skills_for_user(user_id)) == 1
+
+        writer.link_user_skill(user_id, writer.get_or_create_skill("listening").id)
+
+        assert {s.skill_name for s in reader.get_skills_for_user(user_id)} == {"empathy", "listening"}
+
+    def test_training_added_by_second_manager(self, db_path, user_id):
+        """add_training on another instance invalidates cached trainings."""
+        reader, writer = DataManager(db_path), DataManager(db_path)
+        assert reader.get_training_for_user(user_id) == []
+
+        _add_training(writer, user_id, "empathy")
+
+        assert len(reader.get_training_for_user(user_id)) == 1
+
+    def test_training_status_updated_by_second_manager(self, db_path, user_id):
+        """update_training_status on another instance invalidates cached trainings."""
+        reader, writer = DataManager(db_path), DataManager(db_path)
+        _add_training(writer, user_id, "empathy")
+        training = reader.get_training_for_user(user_id)[0]
+        assert training.status == "pending"
+
+        writer.update_training_status(user_id, training.skill_id, "completed")
+
+        assert reader.get_training_for_user(user_id)[0].status == "completed"
+
+    def test_other_database_is_not_shared(self, tmp_path, user_id, db_path):
+        """Entries are keyed by database, so another file keeps its own rows."""
+        DataManager(db_path).set_skill_for_user(user_id, Skill(skill_name="empathy"))
+        assert DataManager(str(tmp_path / "other.db")).get_skills_for_user(user_id) is None
+
+
+class TestCachedRows:
+    """Cache hits, copies and expiry."""
+
+    def test_second_read_is_served_from_cache(self, db_path, user_id, monkeypatch):
+        """A repeated read does not query the database again."""
+        dm = DataManager(db_path)
+        _add_training(dm, user_id, "empathy")
+        dm.get_training_for_user(user_id)
+
+        monkeypatch.setattr(dm, "get_session", None)
+        assert len(dm.get_training_for_user(user_id)) == 1
+
+    def test_returned_lists_are_copies(self, db_path, user_id):
+        """Mutating a returned list does not change what the next caller gets."""
+        dm = DataManager(db_path)
+        dm.set_skill_for_user(user_id, Skill(skill_name="empathy"))
+        _add_training(dm, user_id, "empathy")
+
+        dm.get_skills_for_user(user_id).clear()
+        dm.get_training_for_user(user_id).clear()
+
+        assert len(dm.get_skills_for_user(user_id)) == 1
+        assert len(dm.get_training_for_user(user_id)) == 1
+
+    def test_entries_expire_after_ttl(self, db_path, user_id, monkeypatch):
+        """Writes made outside DataManager are picked up once the TTL runs out."""
+        dm = DataManager(db_path)
+        assert dm.get_training_for_user(user_id) == []
+        with dm.data_model.SessionLocal() as session:
+            session.add(Training(user_id=user_id, skill_id=dm.get_or_create_skill("empathy").id))
+            session.commit()
+        assert dm.get_training_for_user(user_id) == []
+
+        now = data_manager.time.monotonic()
+        ttl = data_manager._training_cache.ttl
+        monkeypatch.setattr(data_manager.time, "monotonic", lambda: now + ttl)
+
+        assert len(dm.get_training_for_user(user_id)) == 1
+
+
+class TestUserRowsCache:
+    """Invalidation ordering and size bound of the cache itself."""
+
+    def test_rows_loaded_before_invalidation_are_not_stored(self):
+        """A reader that queried before a commit cannot put old rows back."""
+        cache = _UserRowsCache()
+        generation = cache.generation(("db", 1))
+        cache.invalidate(("db", 1))  # writer commits while the reader queries
+
+        cache.put(("db", 1), generation, ["old row"])
+
+        assert cache.get(("db", 1)) == (False, None)
+
+    def test_oldest_entry_is_evicted(self):
+        """The cache holds at most maxsize users."""
+        cache = _UserRowsCache(maxsize=2)
+        for user in (1, 2, 3):
+            cache.put(("db", user), 0, [user])
+
+        assert cache.get(("db", 1)) == (False, None)
+        assert cache.get(("db", 3)) == (True, [3])
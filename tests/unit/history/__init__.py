@@ -0,0 +1,9 @@
+"""
+Tests for Conversation History
+
+LOCATION: tests/unit/history/
+PURPOSE: Unit tests for memory/rolling_history.py
+
+Test Modules:
+    - test_rolling_history: Recent-message queue and running summary
+"""
@@ -0,0 +1,151 @@
+"""
+Tests for RollingHistory
+
+LOCATION: tests/unit/history/test_rolling_history.py
+PURPOSE: Eviction into the summary, batched folds, summary persistence and
+    the fallback when the summarizer fails
+"""
+
+import pytest
+
+from memory.rolling_history import RollingHistory, extractive_summary
+
+
+def _user(text: str) -> dict:
+    """User message with the given content."""
+    return {"role": "user", "content": text}
+
+
+def _contents(history: RollingHistory) -> list:
+    """Contents of the recent messages, oldest first."""
+    return [m["content"] for m in history]
+
+
+class RecordingSummarizer:
+    """Summarizer stub recording the batches it receives."""
+
+    def __init__(self, fail: bool = False):
+        self.batches = []
+        self.fail = fail
+
+    def __call__(self, previous, messages):
+        self.batches.append([m["content"] for m in messages])
+        if self.fail:
+            raise RuntimeError("summarizer unavailable")
+        return f"{previous}|{len(messages)}"
+
+
+class TestEviction:
+    """The queue keeps the newest maxlen messages."""
+
+    def test_initial_messages_are_trimmed_to_maxlen(self):
+        """Only the last maxlen initial messages are kept."""
+        history = RollingHistory([_user(str(i)) for i in range(5)], maxlen=3)
+        assert _contents(history) == ["2", "3", "4"]
+        assert history.summary == ""
+
+    def test_append_to_full_queue_evicts_oldest(self):
+        """A full queue drops its oldest message when a new one arrives."""
+        history = RollingHistory(maxlen=2, batch_size=1)
+        for text in ("a", "b", "c"):
+            history.append(_user(text))
+        assert _contents(history) == ["b", "c"]
+        assert len(history) == 2
+        assert history.summary == "user: a"
+
+    def test_no_eviction_below_maxlen(self):
+        """Appending below capacity never summarizes."""
+        summarizer = RecordingSummarizer()
+        history = RollingHistory(maxlen=3, batch_size=1, summarizer=summarizer)
+        for text in ("a", "b", "c"):
+            history.append(_user(text))
+        assert summarizer.batches == []
+
+
+class TestBatchedFolds:
+    """Evicted messages are summarized batch_size at a time."""
+
+    def test_fold_waits_for_a_full_batch(self):
+        """The summarizer runs once per batch_size evictions, in order."""
+        summarizer = RecordingSummarizer()
+        history = RollingHistory(maxlen=2, batch_size=3, summarizer=summarizer)
+        for text in "abcdefgh":
+            history.append(_user(text))
+
+        assert summarizer.batches == [["a", "b", "c"], ["d", "e", "f"]]
+        assert history.summary == "|3|3"
+        assert _contents(history) == ["g", "h"]
+
+    def test_fold_continues_from_persisted_summary(self):
+        """A summary passed in is extended, not replaced."""
+        history = RollingHistory([_user("a")], maxlen=1, batch_size=1, summary="user: earlier")
+        history.append(_user("b"))
+        assert history.summary == "user: earlier\nuser: a"
+
+
+class TestOnSummary:
+    """The persistence callback sees every new summary."""
+
+    def test_called_after_each_fold(self):
+        """on_summary receives the summary produced by each fold."""
+        saved = []
+        history = RollingHistory(maxlen=1, batch_size=2, on_summary=saved.append)
+        for text in "abcde":
+            history.append(_user(text))
+        assert saved == ["user: a\nuser: b", "user: a\nuser: b\nuser: c\nuser: d"]
+        assert saved[-1] == history.summary
+
+    def test_not_called_without_fold(self):
+        """Appends that do not complete a batch do not persist anything."""
+        saved = []
+        history = RollingHistory(maxlen=1, batch_size=5, on_summary=saved.append)
+        for text in "abc":
+            history.append(_user(text))
+        assert saved == []
+
+
+class TestSummarizerFailure:
+    """A failing summarizer falls back to the extractive summary."""
+
+    def test_failure_uses_extractive_fallback(self):
+        """The evicted batch is still folded into the summary."""
+        saved = []
+        summarizer = RecordingSummarizer(fail=True)
+        history = RollingHistory(
+            maxlen=1, batch_size=2, summarizer=summarizer, on_summary=saved.append
+        )
+        for text in "abc":
+            history.append(_user(text))
+
+        assert summarizer.batches == [["a", "b"]]
+        assert history.summary == "user: a\nuser: b"
+        assert saved == [history.summary]
+
+    def test_failure_is_logged(self, caplog):
+        """The fallback is reported through the module logger."""
+        history = RollingHistory(maxlen=1, batch_size=1, summarizer=RecordingSummarizer(fail=True))
+        with caplog.at_level("WARNING", logger="memory.rolling_history"):
+            history.append(_user("a"))
+            history.append(_user("b"))
+        assert "summarizer unavailable" in caplog.text
+
+
+class TestExtractiveSummary:
+    """The default summarizer without an LLM."""
+
+    def test_lines_are_truncated_and_whitespace_collapsed(self):
+        """Each message becomes one role-prefixed, shortened line."""
+        summary = extractive_summary("", [_user("hello \n  there " + "x" * 50)], max_line_chars=10)
+        assert summary == "user: hello ther"
+
+    def test_empty_messages_are_skipped(self):
+        """Messages without content add no line."""
+        assert extractive_summary("user: a", [_user("  "), {"role": "assistant"}]) == "user: a"
+
+    @pytest.mark.parametrize("count", [5, 50])
+    def test_oldest_lines_are_dropped_beyond_max_chars(self, count):
+        """The summary never exceeds max_chars and keeps the newest line."""
+        messages = [_user(f"message {i}") for i in range(count)]
+        summary = extractive_summary("", messages, max_chars=40)
+        assert len(summary) <= 40
+        assert summary.endswith(f"user: message {count - 1}")
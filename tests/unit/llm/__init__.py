@@ -0,0 +1,9 @@
+"""
+Tests for LLM Management
+
+LOCATION: tests/unit/llm/
+PURPOSE: Unit tests for LLM instance creation and caching
+
+Test Modules:
+    - test_llm_manager: LLMManager.get_llm instance cache
+"""
@@ -0,0 +1,61 @@
+"""
+Tests for the LLMManager Instance Cache
+
+LOCATION: tests/unit/llm/test_llm_manager.py
+PURPOSE: get_llm reuses instances per configuration, and client-controlled
+    configuration values cannot grow the cache without bound
+"""
+
+from collections import OrderedDict
+
+import pytest
+
+import llm_manager
+from llm_manager import LLMManager
+
+
+@pytest.fixture(autouse=True)
+def fake_llms(monkeypatch):
+    """Empty cache of size 2 and a _create_llm that records what it built."""
+    created = []
+
+    def create(provider, model, *args, **kwargs):
+        created.append(model)
+        return object()
+
+    monkeypatch.setattr(llm_manager, "_LLM_CACHE", OrderedDict())
+    monkeypatch.setattr(llm_manager, "_LLM_CACHE_MAXSIZE", 2)
+    monkeypatch.setattr(LLMManager, "_create_llm", staticmethod(create))
+    return created
+
+
+def test_same_configuration_returns_same_instance(fake_llms):
+    """Repeated calls with identical arguments build one instance."""
+    assert LLMManager.get_llm(model="a") is LLMManager.get_llm(model="a")
+    assert fake_llms == ["a"]
+
+
+def test_cache_is_capped(fake_llms):
+    """Distinct configurations beyond the cap evict the oldest instance."""
+    for temperature in (0.1, 0.2, 0.3, 0.4):
+        LLMManager.get_llm(model="a", temperature=temperature)
+    assert len(llm_manager._LLM_CACHE) == 2
+
+
+def test_least_recently_used_is_evicted(fake_llms):
+    """A cache hit keeps an instance; the one unused longest is dropped."""
+    first = LLMManager.get_llm(model="a")
+    LLMManager.get_llm(model="b")
+    assert LLMManager.get_llm(model="a") is first  # "a" is now most recent
+
+    LLMManager.get_llm(model="c")  # evicts "b"
+
+    assert LLMManager.get_llm(model="a") is first
+    LLMManager.get_llm(model="b")
+    assert fake_llms == ["a", "b", "c", "b"]
+
+
+def test_unhashable_kwargs_are_not_cached(fake_llms):
+    """Unhashable provider kwargs build a fresh, uncached instance."""
+    LLMManager.get_llm(model="a", model_kwargs={"top_p": 1})
+    assert len(llm_manager._LLM_CACHE) == 0
@@ -8,4 +8,5 @@ Test Modules:
     - test_ote_logger: Logger functionality
     - test_metrics: Performance metrics tracking
     - test_decorators: OTE decorators
+    - test_llm_cache: LLM response cache
 """
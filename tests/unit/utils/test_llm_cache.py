@@ -0,0 +1,123 @@
+"""
+Tests for LLM Response Cache
+
+LOCATION: tests/unit/utils/test_llm_cache.py
+PURPOSE: Cache storage, expiry and opt-in configuration; key normalization
+    must never merge messages with different meaning
+"""
+
+import time
+
+import pytest
+
+from app.utils import llm_cache
+from app.utils.llm_cache import LLMResponseCache, make_cache_key, normalize_text
+
+
+def _key(text: str) -> str:
+    """Cache key as built by ClarifyCommunicationTool for a text."""
+    return make_cache_key(text=normalize_text(text), target_language="English")
+
+
+class TestNormalizeText:
+    """normalize_text only canonicalizes encoding and whitespace."""
+
+    @pytest.mark.parametrize("first, second", [
+        ("año", "ano"),
+        ("schön", "schon"),
+        ("I love you ❤️", "I love you 🖕"),
+        ("You are great.", "YOU ARE GREAT?!"),
+        ("Let's eat, grandma", "Let's eat grandma"),
+    ])
+    def test_meaningful_differences_do_not_collide(self, first, second):
+        """Accents, emoji, case and punctuation stay part of the key."""
+        assert _key(first) != _key(second)
+
+    def test_whitespace_is_collapsed(self):
+        """Leading, trailing and repeated whitespace do not change the key."""
+        assert _key("  hello \n\t world ") == _key("hello world")
+
+    def test_unicode_composition_is_normalized(self):
+        """Precomposed and combining-accent forms of a letter share a key."""
+        assert _key("a\u00f1o") == _key("an\u0303o")
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Fresh cache backed by a temporary SQLite file."""
+    return LLMResponseCache(str(tmp_path / "cache.db"), ttl=60)
+
+
+@pytest.fixture
+def no_singleton(monkeypatch):
+    """Reset the process-wide cache so get_llm_cache re-reads the environment."""
+    monkeypatch.setattr(llm_cache, "_llm_cache", None)
+
+
+class TestLLMResponseCache:
+    """Storage, expiry and hit/miss accounting."""
+
+    def test_set_then_get_returns_value(self, cache):
+        """A stored response is returned for the same key."""
+        cache.set("k", "analysis")
+        assert cache.get("k") == "analysis"
+        assert cache.stats == {"hits": 1, "misses": 0}
+
+    def test_missing_key_is_a_miss(self, cache):
+        """Unknown keys return None and count as misses."""
+        assert cache.get("unknown") is None
+        assert cache.stats == {"hits": 0, "misses": 1}
+
+    def test_set_replaces_existing_value(self, cache):
+        """Storing under an existing key overwrites it."""
+        cache.set("k", "old")
+        cache.set("k", "new")
+        assert cache.get("k") == "new"
+
+    def test_expired_entry_is_a_miss(self, cache, monkeypatch):
+        """Entries older than the TTL are not returned."""
+        cache.set("k", "analysis")
+        now = time.time()
+        monkeypatch.setattr(llm_cache.time, "time", lambda: now + cache.ttl + 1)
+        assert cache.get("k") is None
+        assert cache.stats["misses"] == 1
+
+    def test_persists_across_instances(self, tmp_path):
+        """A new cache on the same file sees earlier entries."""
+        LLMResponseCache(str(tmp_path / "cache.db")).set("k", "analysis")
+        assert LLMResponseCache(str(tmp_path / "cache.db")).get("k") == "analysis"
+
+
+class TestGetLLMCache:
+    """The process-wide cache is opt-in."""
+
+    def test_disabled_by_default(self, monkeypatch, no_singleton):
+        """Without LLM_CACHE_ENABLED no cache (and no file) is created."""
+        monkeypatch.delenv("LLM_CACHE_ENABLED", raising=False)
+        assert llm_cache.get_llm_cache() is None
+
+    @pytest.mark.parametrize("value", ["false", "0", "no", ""])
+    def test_disabled_values(self, monkeypatch, no_singleton, value):
+        """Values other than 1/true/yes keep the cache off."""
+        monkeypatch.setenv("LLM_CACHE_ENABLED", value)
+        assert llm_cache.get_llm_cache() is None
+
+    def test_enabled_uses_configured_path(self, monkeypatch, no_singleton, tmp_path):
+        """LLM_CACHE_ENABLED=true builds one cache at LLM_CACHE_PATH."""
+        db_path = tmp_path / "llm_cache.db"
+        monkeypatch.setenv("LLM_CACHE_ENABLED", "true")
+        monkeypatch.setenv("LLM_CACHE_PATH", str(db_path))
+        cache = llm_cache.get_llm_cache()
+        assert cache is not None
+        assert cache.db_path == str(db_path)
+        assert llm_cache.get_llm_cache() is cache
+
+    def test_relative_path_resolves_from_project_root(self, monkeypatch, no_singleton, tmp_path):
+        """A relative LLM_CACHE_PATH does not depend on the working directory."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("LLM_CACHE_ENABLED", "true")
+        monkeypatch.setenv("LLM_CACHE_PATH", "data/test_llm_cache.sqlite.db")
+        monkeypatch.setattr(llm_cache, "LLMResponseCache", lambda db_path, ttl: db_path)
+        assert llm_cache.get_llm_cache() == str(
+            llm_cache._PROJECT_ROOT / "data" / "test_llm_cache.sqlite.db"
+        )
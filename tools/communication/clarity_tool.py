@@ -7,6 +7,8 @@ PURPOSE: Translate and clarify cross-cultural communication with OTE tracking
 TRACE POINTS:
     - VALIDATE: Input validation
     - DETECT: Language detection
+    - CACHE_HIT: Exact-match response cache (app/utils/llm_cache.py)
+    - COALESCE: Concurrent identical request joined an in-flight LLM call
     - TRANSLATE: LLM translation
     - CLARIFY: Explanation generation
     
@@ -19,15 +21,62 @@ OTE COMPLIANCE:
     - Evaluation: Translation performance, language detection metrics
 """
 
-from typing import Type, Optional, Any, Dict
+import asyncio
+import threading
+import weakref
+from typing import Type, Optional, Any, Dict, Tuple
 from langchain.tools import BaseTool
 from pydantic import BaseModel, Field
 
-from app.utils import get_logger, observe, traceable
+from app.utils import (
+    get_logger, observe, traceable,
+    LLMResponseCache, get_llm_cache, make_cache_key, normalize_text,
+)
 
 # Get logger for this module
 logger = get_logger(__name__)
 
+# Static prompt text lives at module level; only the variables are filled per call
+CLARIFICATION_PROMPT_TEMPLATE = """You are a SOCIAL SKILLS COACH analyzing communication.
+
+Text to analyze: "{text}"
+Target language: {target_language}
+Context: {context}
+
+ANALYZE THIS MESSAGE AND RESPOND WITH THIS EXACT FORMAT:
+
+EMPATHY_STATUS: [PROBLEMATIC or OK]
+REASON: [Why it's problematic or why it's fine]
+COACHING: [Your coaching advice - explain impact and suggest better alternatives]
+
+PRIORITY ORDER:
+1. **EMPATHY CHECK (MOST IMPORTANT)**: Is this message kind? Could it hurt feelings?
+2. **CLARITY CHECK**: Is it clear and understandable?
+3. **TRANSLATION**: Only if text is in different language than {target_language}
+
+If the message contains insults, aggression, or unkind words:
+- Set EMPATHY_STATUS: PROBLEMATIC
+- Explain in COACHING why it's hurtful and how to express it better
+
+Respond in {target_language}."""
+
+# In-flight clarification LLM calls per event loop, keyed by cache key. Shared
+# by all tool instances so identical requests from different agents make one call.
+_INFLIGHT: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Future]]" = (
+    weakref.WeakKeyDictionary()
+)
+_INFLIGHT_LOCK = threading.Lock()
+
+
+def _loop_inflight() -> Dict[str, asyncio.Future]:
+    """In-flight calls of the running event loop (only touched from that loop)."""
+    loop = asyncio.get_running_loop()
+    with _INFLIGHT_LOCK:
+        inflight = _INFLIGHT.get(loop)
+        if inflight is None:
+            inflight = _INFLIGHT[loop] = {}
+    return inflight
+
 
 class ClarifyCommunicationInput(BaseModel):
     """
@@ -139,20 +188,10 @@ class ClarifyCommunicationTool(BaseTool):
         Returns:
             Dictionary with translation, clarification, and metadata
         """
-        # TRACE POINT 1: Validation
-        logger.trace("VALIDATE", f"Validating text length={len(text)}, target={target_language}")
-        
-        if not text or not text.strip():
-            logger.warning("Empty text provided")
-            return {
-                "error": "No text provided for clarification",
-                "original_text": text
-            }
-        
-        # TRACE POINT 2: Detect foreign language
-        logger.trace("DETECT", "Detecting foreign characters")
-        has_foreign_chars = any(ord(char) > 127 for char in text)
-        logger.observe("language_detected", has_foreign_chars=has_foreign_chars)
+        # TRACE POINTS 1-2: Validation and detection
+        error, has_foreign_chars = self._validate_and_detect(text, target_language)
+        if error:
+            return error
         
         # TRACE POINT 3: Translate and clarify
         try:
@@ -164,12 +203,43 @@ class ClarifyCommunicationTool(BaseTool):
                 has_foreign_chars=has_foreign_chars
             )
         except Exception as e:
-            logger.error(f"Error clarifying communication: {str(e)}", exc_info=True)
-            logger.observe("clarify_complete", success=False, error=str(e))
+            return self._error_result(text, e)
+    
+    def _validate_and_detect(self, text: str, target_language: str) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """
+        Validate input text and detect non-ASCII characters.
+        
+        Args:
+            text: Text to clarify
+            target_language: Target language
+            
+        Returns:
+            Tuple of (error dict or None, has_foreign_chars)
+        """
+        # TRACE POINT 1: Validation
+        logger.trace("VALIDATE", f"Validating text length={len(text)}, target={target_language}")
+        
+        if not text or not text.strip():
+            logger.warning("Empty text provided")
             return {
-                "error": f"Error clarifying communication: {str(e)}",
+                "error": "No text provided for clarification",
                 "original_text": text
-            }
+            }, False
+        
+        # TRACE POINT 2: Detect foreign language
+        logger.trace("DETECT", "Detecting foreign characters")
+        has_foreign_chars = not text.isascii()
+        logger.observe("language_detected", has_foreign_chars=has_foreign_chars)
+        return None, has_foreign_chars
+    
+    def _error_result(self, text: str, e: Exception) -> Dict[str, Any]:
+        """Log a clarification failure and build the error response."""
+        logger.error(f"Error clarifying communication: {str(e)}", exc_info=True)
+        logger.observe("clarify_complete", success=False, error=str(e))
+        return {
+            "error": f"Error clarifying communication: {str(e)}",
+            "original_text": text
+        }
     
     @traceable()
     @observe("translate_clarify")
@@ -199,37 +269,143 @@ class ClarifyCommunicationTool(BaseTool):
         """
         logger.trace("TRANSLATE", f"Translating from {source_language or 'auto'} to {target_language}")
         
-        # Build clarification prompt - EMPATHY FIRST, TRANSLATION SECOND
-        clarification_prompt = f"""You are a SOCIAL SKILLS COACH analyzing communication.
-
-Text to analyze: "{text}"
-Target language: {target_language}
-Context: {context or "General conversation"}
-
-ANALYZE THIS MESSAGE AND RESPOND WITH THIS EXACT FORMAT:
-
-EMPATHY_STATUS: [PROBLEMATIC or OK]
-REASON: [Why it's problematic or why it's fine]
-COACHING: [Your coaching advice - explain impact and suggest better alternatives]
-
-PRIORITY ORDER:
-1. **EMPATHY CHECK (MOST IMPORTANT)**: Is this message kind? Could it hurt feelings?
-2. **CLARITY CHECK**: Is it clear and understandable?
-3. **TRANSLATION**: Only if text is in different language than {target_language}
-
-If the message contains insults, aggression, or unkind words:
-- Set EMPATHY_STATUS: PROBLEMATIC
-- Explain in COACHING why it's hurtful and how to express it better
-
-Respond in {target_language}."""
-
-        # Call LLM
-        logger.trace("LLM_CALL", "Invoking LLM for clarification")
-        response = self.llm.invoke(clarification_prompt)
+        cache, cache_key, analysis = self._cache_lookup(text, source_language, target_language, context)
+        from_cache = analysis is not None
+        
+        if not from_cache:
+            # Call LLM
+            logger.trace("LLM_CALL", "Invoking LLM for clarification")
+            response = self.llm.invoke(self._build_prompt(text, target_language, context))
+            analysis = response.content
+            if cache:
+                cache.set(cache_key, analysis)
+        
+        return self._build_result(text, analysis, has_foreign_chars, from_cache)
+    
+    async def _atranslate_and_clarify(
+        self,
+        text: str,
+        source_language: Optional[str],
+        target_language: str,
+        context: Optional[str],
+        has_foreign_chars: bool
+    ) -> Dict[str, Any]:
+        """
+        Async counterpart of _translate_and_clarify using llm.ainvoke.
         
-        # Build structured result with clear empathy focus
+        Concurrent clarifications interleave at the HTTP layer instead of
+        each occupying a worker thread.
+        """
+        logger.trace("TRANSLATE", f"Translating from {source_language or 'auto'} to {target_language} (async)")
+        
+        cache, cache_key, analysis = self._cache_lookup(text, source_language, target_language, context)
+        from_cache = analysis is not None
+        
+        if not from_cache:
+            analysis = await self._acoalesced_llm_call(text, target_language, context, cache, cache_key)
+        
+        return self._build_result(text, analysis, has_foreign_chars, from_cache)
+    
+    async def _acoalesced_llm_call(
+        self,
+        text: str,
+        target_language: str,
+        context: Optional[str],
+        cache: Optional[LLMResponseCache],
+        cache_key: str
+    ) -> str:
+        """
+        Run the LLM call once per cache key, sharing it with concurrent callers.
+        
+        A burst of identical requests arriving before the first response is
+        cached awaits the same task instead of issuing N identical calls. The
+        call runs in its own task and every caller awaits it through
+        asyncio.shield, so cancelling one caller (e.g. a client disconnect)
+        neither cancels the call nor fails the others.
+        """
+        inflight = _loop_inflight()
+        task = inflight.get(cache_key)
+        if task is None:
+            logger.trace("LLM_CALL", "Invoking LLM for clarification (async)")
+            task = asyncio.ensure_future(
+                self._allm_call(text, target_language, context, cache, cache_key)
+            )
+            inflight[cache_key] = task
+            
+            def _forget(done: asyncio.Future) -> None:
+                if inflight.get(cache_key) is done:
+                    del inflight[cache_key]
+                if not done.cancelled():
+                    done.exception()  # Mark retrieved when every caller was cancelled
+            
+            task.add_done_callback(_forget)
+        else:
+            logger.trace("COALESCE", "Joining in-flight clarification")
+        return await asyncio.shield(task)
+    
+    async def _allm_call(
+        self,
+        text: str,
+        target_language: str,
+        context: Optional[str],
+        cache: Optional[LLMResponseCache],
+        cache_key: str
+    ) -> str:
+        """Invoke the LLM for a clarification and store the analysis in the cache."""
+        response = await self.llm.ainvoke(self._build_prompt(text, target_language, context))
         analysis = response.content
+        if cache:
+            cache.set(cache_key, analysis)
+        return analysis
+    
+    def _cache_lookup(
+        self,
+        text: str,
+        source_language: Optional[str],
+        target_language: str,
+        context: Optional[str]
+    ) -> Tuple[Optional[LLMResponseCache], str, Optional[str]]:
+        """
+        Look up a previous analysis for the same request (text compared up
+        to Unicode form and whitespace).
+        
+        Returns:
+            Tuple of (cache or None, cache key, cached analysis or None).
+            The key is computed even when the cache is disabled so that
+            concurrent identical calls can still be coalesced.
+        """
+        cache_key = make_cache_key(
+            text=normalize_text(text),
+            source_language=source_language,
+            target_language=target_language,
+            context=context,
+            model=getattr(self.llm, "model_name", None) or getattr(self.llm, "model", None)
+        )
+        cache = get_llm_cache()
+        if not cache:
+            return None, cache_key, None
         
+        analysis = cache.get(cache_key)
+        if analysis is not None:
+            logger.trace("CACHE_HIT", "Using cached clarification")
+        return cache, cache_key, analysis
+    
+    def _build_prompt(self, text: str, target_language: str, context: Optional[str]) -> str:
+        """Fill the clarification prompt - EMPATHY FIRST, TRANSLATION SECOND."""
+        return CLARIFICATION_PROMPT_TEMPLATE.format(
+            text=text,
+            target_language=target_language,
+            context=context or "General conversation"
+        )
+    
+    def _build_result(
+        self,
+        text: str,
+        analysis: str,
+        has_foreign_chars: bool,
+        from_cache: bool
+    ) -> Dict[str, Any]:
+        """Build structured result with clear empathy focus."""
         # Detect if message is problematic - LLM explicitly states this
         is_problematic = "EMPATHY_STATUS: PROBLEMATIC" in analysis or "EMPATHY_STATUS:PROBLEMATIC" in analysis
         
@@ -250,8 +426,9 @@ Respond in {target_language}."""
         logger.observe(
             "clarify_complete",
             text_length=len(text),
-            response_length=len(response.content),
+            response_length=len(analysis),
             has_foreign=has_foreign_chars,
+            cached=from_cache,
             success=True
         )
         
@@ -270,25 +447,41 @@ Respond in {target_language}."""
         Returns:
             Clarification results
         """
-        logger.trace("INVOKE", f"Tool invoked with type: {type(input_data)}")
+        input_type = type(input_data)
+        logger.trace("INVOKE", f"Tool invoked with type: {input_type}")
         
         try:
-            if isinstance(input_data, dict):
+            # Exact-type checks first (the common case); isinstance only for subclasses
+            if input_type is dict or isinstance(input_data, dict):
                 return self._run(**input_data)
-            elif isinstance(input_data, str):
+            elif input_type is str or isinstance(input_data, str):
                 return self._run(text=input_data)
             else:
-                logger.warning(f"Invalid input format: {type(input_data)}")
+                logger.warning(f"Invalid input format: {input_type}")
                 return {"error": "Invalid input format for clarify_communication"}
         except Exception as e:
             logger.error(f"Error in invoke: {str(e)}", exc_info=True)
             return {"error": f"Error in clarify_communication: {str(e)}"}
     
-    async def _arun(self, *args, **kwargs) -> Dict[str, Any]:
+    async def _arun(self, text: str, source_language: Optional[str] = None,
+                    target_language: str = "English", context: Optional[str] = None) -> Dict[str, Any]:
         """
         Async version of run.
         
-        Note:
-            Currently calls sync version. Can be optimized for async LLM calls.
+        Awaits llm.ainvoke directly so the event loop is never blocked
+        on the LLM round trip.
         """
-        return self._run(*args, **kwargs)
+        error, has_foreign_chars = self._validate_and_detect(text, target_language)
+        if error:
+            return error
+        
+        try:
+            return await self._atranslate_and_clarify(
+                text=text,
+                source_language=source_language,
+                target_language=target_language,
+                context=context,
+                has_foreign_chars=has_foreign_chars
+            )
+        except Exception as e:
+            return self._error_result(text, e)
@@ -11,6 +11,7 @@ FEATURES:
     - Provide suggestions for better phrasing
 """
 
+import asyncio
 from typing import Type, Optional, Dict, Any, ClassVar
 from langchain.tools import BaseTool
 from pydantic import BaseModel, Field
@@ -20,7 +21,8 @@ logger = get_logger()
 
 # Import web search
 try:
-    from langchain_tavily import TavilySearch
+    import langchain_tavily  # noqa: F401
+    from tools.search import get_tavily_search
     WEB_SEARCH_AVAILABLE = True
 except ImportError:
     logger.logger.warning("⚠️  Tavily search not available")
@@ -89,7 +91,7 @@ class CulturalStandardsChecker(BaseTool):
         
         if WEB_SEARCH_AVAILABLE:
             try:
-                self.search_tool = TavilySearch(max_results=5)
+                self.search_tool = get_tavily_search(max_results=5)
                 logger.logger.info("✅ Cultural checker initialized with web search")
             except Exception as e:
                 logger.logger.warning(f"Could not initialize web search: {e}")
@@ -236,5 +238,5 @@ class CulturalStandardsChecker(BaseTool):
             return None
     
     async def _arun(self, *args, **kwargs):
-        """Async version calls sync version."""
-        return self._run(*args, **kwargs)
+        """Async version runs the sync check in a worker thread."""
+        return await asyncio.to_thread(self._run, *args, **kwargs)
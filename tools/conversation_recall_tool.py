@@ -18,6 +18,7 @@ from typing import Type, Optional, Dict, Any
 from langchain.tools import BaseTool
 from pydantic import BaseModel, Field
 
+from app.utils import fast_json
 from datamanager.data_manager import DataManager
 
 
@@ -203,18 +204,31 @@ class ConversationRecallTool(BaseTool):
         return self._run(*args, **kwargs)
 
     def _get_conversation(self, user_id: int) -> str:
+        """
+        Serialize the result of recall() for the LLM-facing tool interface.
+        
+        Args:
+            user_id (int): The unique identifier of the user
+        
+        Returns:
+            str: JSON string of the recall() result
+        """
+        return fast_json.dumps(self.recall(user_id))
+
+    def recall(self, user_id: int) -> Dict[str, Any]:
         """
         Core implementation of conversation retrieval.
         
         Retrieves conversation history from the database for a specific user
-        and formats it as a JSON response. Returns only the last 5 messages
+        and returns it as a dictionary, so in-process callers can use it
+        without a JSON round trip. Returns only the last 5 messages
         to keep the context manageable while providing relevant history.
         
         Args:
             user_id (int): The unique identifier of the user
         
         Returns:
-            str: JSON string containing:
+            Dict[str, Any]: Result dictionary containing:
                 Success case:
                 {
                     "status": "success",
@@ -241,11 +255,10 @@ class ConversationRecallTool(BaseTool):
         
         Raises:
             No exceptions are raised; all errors are caught and returned
-            as JSON error responses.
+            as error dictionaries.
         
         Example:
-            >>> result = tool._get_conversation(user_id=1)
-            >>> data = json.loads(result)
+            >>> data = tool.recall(user_id=1)
             >>> print(data["status"])
             success
         
@@ -260,10 +273,10 @@ class ConversationRecallTool(BaseTool):
             user = self.dm.get_user(user_id)
             
             if not user:
-                return json.dumps({
+                return {
                     "status": "error",
                     "message": f"User {user_id} not found"
-                })
+                }
             
             # Try to get from encrypted memory first
             try:
@@ -290,7 +303,7 @@ class ConversationRecallTool(BaseTool):
                     chat_count = sum(1 for msg in last_messages 
                                    if isinstance(msg, dict) and msg.get('type') in ['chat', 'general'])
                     
-                    return json.dumps({
+                    return {
                         "status": "success",
                         "message": "Conversation retrieved from encrypted memory",
                         "data": last_messages,
@@ -300,7 +313,7 @@ class ConversationRecallTool(BaseTool):
                         "returned_messages": len(last_messages),
                         "ai_messages": ai_count,
                         "chat_messages": chat_count
-                    })
+                    }
                     
             except ImportError:
                 # Fallback to old system if memory module not available
@@ -310,11 +323,11 @@ class ConversationRecallTool(BaseTool):
             
             # Fallback to old messages field if memory not available
             if not user.messages or user.messages == "[]":
-                return json.dumps({
+                return {
                     "status": "success",
                     "message": "No previous conversation found",
                     "data": [],
-                })
+                }
 
             # Parse the old messages field
             try:
@@ -328,23 +341,23 @@ class ConversationRecallTool(BaseTool):
 
                 last_messages = messages[-10:] if len(messages) > 10 else messages
                 
-                return json.dumps({
+                return {
                     "status": "success",
                     "message": "Conversation retrieved (legacy)",
                     "data": last_messages,
                     "total_messages": len(messages),
                     "returned_messages": len(last_messages)
-                })
+                }
 
             except json.JSONDecodeError as e:
-                return json.dumps({
+                return {
                     "status": "error",
                     "message": f"Failed to parse conversation: {str(e)}",
                     "data": [],
-                })
+                }
 
         except Exception as e:
-            return json.dumps({
+            return {
                 "status": "error",
                 "message": f"Failed to retrieve conversation: {str(e)}",
-            })
+            }
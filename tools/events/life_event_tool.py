@@ -23,18 +23,24 @@ OTE COMPLIANCE:
     - Evaluation: Operation success rates, performance metrics
 """
 
-from datetime import datetime
+import asyncio
+import re
+from datetime import datetime, timezone
 from typing import Type, Any, Dict, List, Optional
 from langchain.tools import BaseTool
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, PrivateAttr
 
 from datamanager.data_manager import DataManager
 from datamanager.life_event_manager import LifeEventManager
+from tools.schema_input import FastArgsSchemaMixin
 from app.utils import get_logger, observe, traceable, evaluate
 
 # Get logger for this module
 logger = get_logger(__name__)
 
+# Date prefix of a value fromisoformat rejects (e.g. "2024-05-01 morning")
+_ISO_DATE_PREFIX_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})(?:[T ]|$)")
+
 
 class LifeEventInput(BaseModel):
     """
@@ -61,8 +67,8 @@ class LifeEventInput(BaseModel):
     event_type: Optional[str] = Field(default=None, description="Type of the event")
     title: Optional[str] = Field(default=None, description="Title of the event")
     description: Optional[str] = Field(default=None, description="Detailed description")
-    start_date: Optional[str] = Field(default=None, description="When event started YYYY-MM-DD")
-    end_date: Optional[str] = Field(default=None, description="When event ended YYYY-MM-DD")
+    start_date: Optional[datetime] = Field(default=None, description="When event started YYYY-MM-DD")
+    end_date: Optional[datetime] = Field(default=None, description="When event ended YYYY-MM-DD")
     location: Optional[str] = Field(default=None, description="Where event occurred")
     impact_level: Optional[int] = Field(default=None, description="Importance level 1-10")
     is_private: Optional[bool] = Field(default=True, description="Whether event is private")
@@ -75,16 +81,24 @@ class LifeEventInput(BaseModel):
         """Parse date strings into datetime objects."""
         if isinstance(v, str):
             try:
+                # Plain YYYY-MM-DD (the documented format) skips the parser entirely
+                if len(v) == 10 and v[4] == '-' and v[7] == '-':
+                    return datetime(int(v[:4]), int(v[5:7]), int(v[8:10]))
+                # fromisoformat covers every other ISO form, incl. what strptime did
                 return datetime.fromisoformat(v)
-            except (ValueError, TypeError):
+            except ValueError:
+                pass
+            # Keep the date when only the part after it is unparseable
+            match = _ISO_DATE_PREFIX_RE.match(v)
+            if match:
                 try:
-                    return datetime.strptime(v, '%Y-%m-%d')
-                except (ValueError, TypeError):
+                    return datetime(int(match[1]), int(match[2]), int(match[3]))
+                except ValueError:
                     pass
         return v
 
 
-class LifeEventTool(BaseTool):
+class LifeEventTool(FastArgsSchemaMixin, BaseTool):
     """
     Tool for managing user life events with OTE tracking.
     
@@ -102,7 +116,7 @@ class LifeEventTool(BaseTool):
         name: Tool name for LLM
         description: Tool description for LLM
         args_schema: Pydantic schema for validation
-        dm: DataManager instance
+        _dm: DataManager instance
         event_manager: LifeEventManager for event operations
     
     Example:
@@ -124,7 +138,7 @@ class LifeEventTool(BaseTool):
     Use this tool to record significant life events like birthdays, graduations, job changes, etc.
     """
     args_schema: Type[BaseModel] = LifeEventInput
-    dm: Any = None
+    _dm: Any = PrivateAttr(default=None)
     event_manager: Any = None
     
     def __init__(self, data_manager: DataManager, **kwargs):
@@ -136,11 +150,23 @@ class LifeEventTool(BaseTool):
             **kwargs: Additional Pydantic model data
         """
         super().__init__(**kwargs)
-        self.dm = data_manager
+        self._dm = data_manager
         
+        # One manager per tool; it opens a Session per operation, so
+        # building it costs nothing (Pydantic workaround)
         logger.trace("INIT", "Initializing LifeEventManager")
         object.__setattr__(self, 'event_manager', LifeEventManager(data_manager))
         
+        # Action dispatch table (Pydantic workaround)
+        object.__setattr__(self, '_actions', {
+            'add': self._add_event,
+            'get': lambda user_id, data: self._get_event(user_id, data.get('event_id')),
+            'update': self._update_event,
+            'delete': lambda user_id, data: self._delete_event(user_id, data.get('event_id')),
+            'list': self._list_events,
+            'timeline': lambda user_id, _data: self._get_timeline(user_id),
+        })
+        
         logger.observe("init_complete", has_event_manager=bool(self.event_manager))
     
     @observe("life_event_run")
@@ -166,7 +192,8 @@ class LifeEventTool(BaseTool):
         Execute life event tool asynchronously.
         
         Note:
-            Currently calls sync version. Can be optimized for async DB operations.
+            Runs the sync DB operations in a worker thread so they do not
+            block the event loop.
         
         Args:
             *args: Positional arguments
@@ -175,7 +202,7 @@ class LifeEventTool(BaseTool):
         Returns:
             Dictionary with operation result
         """
-        return self._handle_event(kwargs)
+        return await asyncio.to_thread(self._handle_event, kwargs)
     
     @traceable()
     def _handle_event(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -203,21 +230,11 @@ class LifeEventTool(BaseTool):
         
         try:
             # Route to appropriate handler
-            if action == 'add':
-                return self._add_event(user_id, data)
-            elif action == 'get':
-                return self._get_event(user_id, data.get('event_id'))
-            elif action == 'update':
-                return self._update_event(user_id, data)
-            elif action == 'delete':
-                return self._delete_event(user_id, data.get('event_id'))
-            elif action == 'list':
-                return self._list_events(user_id, data)
-            elif action == 'timeline':
-                return self._get_timeline(user_id)
-            else:
+            handler = self._actions.get(action)
+            if handler is None:
                 logger.warning(f"Unknown action: {action}")
                 return {"status": "error", "message": f"Unknown action: {action}"}
+            return handler(user_id, data)
                 
         except Exception as e:
             logger.error(f"Error in life event tool: {str(e)}", exc_info=True)
@@ -241,12 +258,16 @@ class LifeEventTool(BaseTool):
         """
         logger.trace("ADD", f"Adding event for user={user_id}, type={data.get('event_type')}")
         
+        start_date = data.get('start_date')
+        if start_date is None:
+            start_date = datetime.now(timezone.utc)
+        
         event_data = {
             "user_id": user_id,
             "event_type": data.get('event_type', 'OTHER'),
             "title": data.get('title', 'Untitled Event'),
             "description": data.get('description', ''),
-            "start_date": data.get('start_date', datetime.utcnow()),
+            "start_date": start_date,
             "end_date": data.get('end_date'),
             "location": data.get('location'),
             "people_involved": data.get('people_involved', []),
@@ -263,7 +284,7 @@ class LifeEventTool(BaseTool):
             return {
                 "status": "success",
                 "message": "Life event added successfully",
-                "event": event.dict()
+                "event": event.model_dump(mode="json")
             }
         else:
             logger.observe("add_complete", success=False)
@@ -303,7 +324,7 @@ class LifeEventTool(BaseTool):
         logger.observe("get_complete", success=True, found=True)
         return {
             "status": "success",
-            "event": event.dict()
+            "event": event.model_dump(mode="json")
         }
     
     @traceable()
@@ -348,7 +369,7 @@ class LifeEventTool(BaseTool):
         return {
             "status": "success",
             "message": "Event updated successfully",
-            "event": event.dict()
+            "event": event.model_dump(mode="json")
         }
     
     @traceable()
@@ -419,7 +440,7 @@ class LifeEventTool(BaseTool):
         return {
             "status": "success",
             "count": len(events),
-            "events": [e.dict() for e in events]
+            "events": [e.model_dump(mode="json") for e in events]
         }
     
     @traceable()
@@ -441,9 +462,9 @@ class LifeEventTool(BaseTool):
         
         timeline = self.event_manager.get_timeline(user_id)
         
-        # Convert Pydantic models to dicts for JSON serialization
+        # Convert Pydantic models to JSON-ready dicts (datetimes as ISO strings)
         timeline_dict = {
-            str(year): [e.dict() for e in events] 
+            str(year): [e.model_dump(mode="json") for e in events] 
             for year, events in timeline.items()
         }
         
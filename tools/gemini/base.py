@@ -14,6 +14,7 @@ Author: AI Assistant
 Date: 2025-10-22
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Type, Optional
 from pydantic import BaseModel, Field
@@ -145,10 +146,10 @@ class GeminiToolBase(BaseTool, ABC):
         """
         Async version of _run.
         
-        Default implementation calls _run synchronously.
+        Default implementation runs _run in a worker thread.
         Override this for true async support.
         """
-        return self._run(*args, **kwargs)
+        return await asyncio.to_thread(self._run, *args, **kwargs)
     
     def get_schema_info(self) -> Dict[str, Any]:
         """
@@ -10,6 +10,8 @@ Author: AI Assistant
 Date: 2025-10-22
 """
 
+import asyncio
+import logging
 import os
 from typing import Dict, Any, Optional, Type
 from pydantic import BaseModel, Field
@@ -20,6 +22,8 @@ from .base import GeminiToolBase
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 
 class SearchToolInput(BaseModel):
     """
@@ -97,21 +101,19 @@ class SearchTool(GeminiToolBase):
         api_key = os.getenv('TAVILY_API_KEY')
         
         if not api_key:
-            print("⚠️  WARNING: TAVILY_API_KEY not found in environment")
-            print("   SearchTool will not work without an API key")
+            logger.warning("TAVILY_API_KEY not found in environment; SearchTool will not work without an API key")
             object.__setattr__(self, 'tavily_client', None)
             return
         
         try:
             from langchain_community.tools.tavily_search import TavilySearchResults
             object.__setattr__(self, 'tavily_client', TavilySearchResults(max_results=10))
-            print("✅ Tavily search initialized")
+            logger.debug("Tavily search initialized")
         except ImportError:
-            print("⚠️  WARNING: langchain_community not installed")
-            print("   Install with: pip install langchain-community")
+            logger.warning("langchain_community not installed; install with: pip install langchain-community")
             object.__setattr__(self, 'tavily_client', None)
         except Exception as e:
-            print(f"⚠️  WARNING: Failed to initialize Tavily: {e}")
+            logger.warning("Failed to initialize Tavily: %s", e)
             object.__setattr__(self, 'tavily_client', None)
     
     def _run(self, query: str, max_results: int = 5) -> Dict[str, Any]:
@@ -150,7 +152,7 @@ class SearchTool(GeminiToolBase):
             }
         
         try:
-            print(f"🔍 Searching for: {query}")
+            logger.debug("Searching for: %s", query)
             
             # Perform search
             results = self.tavily_client.invoke({"query": query})
@@ -203,7 +205,7 @@ class SearchTool(GeminiToolBase):
                 }
         
         except Exception as e:
-            print(f"❌ Search error: {e}")
+            logger.exception("Search failed for query: %s", query)
             return {
                 "status": "error",
                 "message": f"Search failed: {str(e)}",
@@ -211,8 +213,8 @@ class SearchTool(GeminiToolBase):
             }
     
     async def _arun(self, query: str, max_results: int = 5) -> Dict[str, Any]:
-        """Async version - calls sync for now."""
-        return self._run(query, max_results)
+        """Async version - runs the sync search in a worker thread."""
+        return await asyncio.to_thread(self._run, query, max_results)
 
 
 # Convenience function to create and use the tool
@@ -13,6 +13,8 @@ Author: Socializer Development Team
 Date: 2024-11-12
 """
 
+import asyncio
+
 from langchain.tools import BaseTool
 from pydantic import BaseModel, Field
 from typing import Optional
@@ -111,5 +113,5 @@ class LanguagePreferenceTool(BaseTool):
             return f"Error: {str(e)}"
     
     async def _arun(self, language: str, confirmed: bool = True) -> str:
-        """Async version."""
-        return self._run(language, confirmed)
+        """Async version - runs the sync DB update in a worker thread."""
+        return await asyncio.to_thread(self._run, language, confirmed)
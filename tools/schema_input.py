@@ -0,0 +1,66 @@
+"""
+Fast args_schema Validation for Tools
+
+LOCATION: tools/schema_input.py
+PURPOSE: Validate tool-call arguments without LangChain's per-call schema introspection
+
+BaseTool._parse_input scans the schema's annotations for InjectedToolCallId,
+dumps the validated model and walks its field info on every call. For flat
+schemas without injected arguments that work never changes the result, so
+FastArgsSchemaMixin validates with the model's compiled pydantic-core
+validator and reads the fields back directly.
+
+USAGE:
+    class UserPreferenceTool(FastArgsSchemaMixin, BaseTool):
+        args_schema: Type[BaseModel] = UserPreferenceInput
+"""
+
+import functools
+from typing import Any, Dict, Optional, Tuple, Union
+
+from pydantic import BaseModel
+
+
+@functools.cache
+def _schema_field_names(schema: type) -> Tuple[str, ...]:
+    """Field names of an args_schema, minus the synthetic *args/**kwargs fields (cached)."""
+    return tuple(name for name in schema.model_fields if name not in ("args", "kwargs"))
+
+
+class FastArgsSchemaMixin:
+    """
+    Drop-in _parse_input for BaseTool subclasses with plain pydantic v2 schemas.
+
+    Returns the same dict as BaseTool._parse_input: every schema field,
+    validated, with defaults applied. String inputs, tools with injected
+    arguments and non-v2 schemas use the LangChain implementation.
+
+    Must precede BaseTool in the bases so its _parse_input wins.
+    """
+
+    def _parse_input(
+        self,
+        tool_input: Union[str, Dict[str, Any]],
+        tool_call_id: Optional[str]
+    ) -> Union[str, Dict[str, Any]]:
+        """
+        Validate tool input against args_schema.
+
+        Args:
+            tool_input: Raw tool input
+            tool_call_id: ID of the tool call, if available
+
+        Returns:
+            Validated input
+        """
+        schema = self.args_schema
+        if (
+            isinstance(tool_input, str)
+            or not isinstance(schema, type)
+            or not issubclass(schema, BaseModel)
+            or self._injected_args_keys
+        ):
+            return super()._parse_input(tool_input, tool_call_id)
+
+        result = schema.model_validate(tool_input)
+        return {name: getattr(result, name) for name in _schema_field_names(schema)}
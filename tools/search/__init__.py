@@ -6,8 +6,21 @@ PURPOSE: Tools for web search and information retrieval
 
 Tools:
     - TavilySearchTool: Web search for real-time information
+    - get_tavily_search: Shared TavilySearch client per result size
 """
 
-from tools.search.tavily_search_tool import TavilySearchTool, TavilySearchInput
+from tools.search.tavily_search_tool import (
+    TavilySearchTool,
+    TavilySearchInput,
+    get_tavily_search,
+    SEARCH_MAX_RESULTS,
+    RESEARCH_MAX_RESULTS,
+)
 
-__all__ = ['TavilySearchTool', 'TavilySearchInput']
+__all__ = [
+    'TavilySearchTool',
+    'TavilySearchInput',
+    'get_tavily_search',
+    'SEARCH_MAX_RESULTS',
+    'RESEARCH_MAX_RESULTS',
+]
@@ -18,15 +18,88 @@ OTE COMPLIANCE:
     - Evaluation: Search performance and result metrics
 """
 
-from typing import Type, Any, Dict
+import functools
+import json
+from typing import Type, Any, Dict, Optional, Tuple
 from langchain.tools import BaseTool
 from pydantic import BaseModel, Field
 
+from tools.schema_input import FastArgsSchemaMixin
 from app.utils import get_logger, observe, traceable
 
 # Get logger for this module
 logger = get_logger(__name__)
 
+# Maximum characters of search output handed back to the LLM
+MAX_RESULT_CHARS = 2000
+
+# Results requested per query: tool output is cut to MAX_RESULT_CHARS and
+# the skill evaluator's research probe keeps only 500 chars, so asking for
+# more only adds bytes over the wire and JSON to parse
+SEARCH_MAX_RESULTS = 3
+RESEARCH_MAX_RESULTS = 1
+
+_json_encoder = json.JSONEncoder(default=str, ensure_ascii=False)
+
+
+def _truncate_result(result: Any, limit: int = MAX_RESULT_CHARS) -> str:
+    """
+    Serialize a search result to at most `limit` characters.
+    
+    Non-string results are encoded incrementally and encoding stops once
+    the limit is reached, so a large Tavily payload is never rendered in
+    full just to keep its first 2000 characters.
+    
+    Args:
+        result: Raw search result
+        limit: Maximum number of characters
+        
+    Returns:
+        Truncated string form of the result
+    """
+    if isinstance(result, str):
+        return result[:limit]
+    
+    parts = []
+    size = 0
+    try:
+        for chunk in _json_encoder.iterencode(result):
+            parts.append(chunk)
+            size += len(chunk)
+            if size >= limit:
+                break
+    except (TypeError, ValueError):
+        # Not JSON-encodable (e.g. circular) - fall back to repr
+        return str(result)[:limit]
+    return "".join(parts)[:limit]
+
+
+def get_tavily_search(max_results: int = SEARCH_MAX_RESULTS) -> Any:
+    """
+    Get the shared TavilySearch client for a result size, created on first use.
+    
+    Every caller (chat agent, skill evaluator, skill agents, cultural
+    checker) shares one client per max_results instead of building its own.
+    Raw page content is never requested.
+    
+    Args:
+        max_results: Number of results the client returns
+        
+    Returns:
+        TavilySearch instance
+    """
+    # Normalize to a positional call so every call style hits the same cache entry
+    return _shared_tavily_search(max_results)
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_tavily_search(max_results: int) -> Any:
+    """Create the TavilySearch client for one result size (cached)."""
+    from langchain_tavily import TavilySearch
+    
+    logger.trace("INIT", f"Creating shared TavilySearch(max_results={max_results})")
+    return TavilySearch(max_results=max_results, include_raw_content=False)
+
 
 class TavilySearchInput(BaseModel):
     """
@@ -38,7 +111,7 @@ class TavilySearchInput(BaseModel):
     query: str = Field(description="The search query string")
 
 
-class TavilySearchTool(BaseTool):
+class TavilySearchTool(FastArgsSchemaMixin, BaseTool):
     """
     Web search tool wrapper with OTE tracking.
     
@@ -60,7 +133,7 @@ class TavilySearchTool(BaseTool):
     
     Example:
         >>> from langchain_tavily import TavilySearch
-        >>> tavily = TavilySearch(max_results=10)
+        >>> tavily = TavilySearch(max_results=3)
         >>> tool = TavilySearchTool(search_tool=tavily)
         >>> result = tool.run("current weather in Paris")
         >>> print(result)
@@ -115,8 +188,8 @@ class TavilySearchTool(BaseTool):
         """
         Execute search asynchronously.
         
-        Note:
-            Currently calls sync version. Can be optimized for async operations.
+        Awaits the search tool's ainvoke so concurrent searches overlap
+        their network round trips instead of blocking the event loop.
         
         Args:
             query: Search query string
@@ -125,7 +198,7 @@ class TavilySearchTool(BaseTool):
         Returns:
             Formatted search results
         """
-        return self._execute_search(query)
+        return await self._aexecute_search(query)
     
     @traceable()
     @observe("execute_search")
@@ -145,40 +218,87 @@ class TavilySearchTool(BaseTool):
             Formatted search results, limited to 2000 chars
         """
         try:
-            # TRACE POINT 1: Validation
-            logger.trace("VALIDATE", f"Validating search query: {type(query)}")
-            
-            if not query:
-                logger.warning("Empty query provided")
-                return "No search query provided."
-            
-            # Handle both string and dict queries
-            search_query = query.get('query', '') if isinstance(query, dict) else str(query)
-            if not search_query.strip():
-                logger.warning("Empty search query after processing")
-                return "Empty search query provided."
+            search_query, error = self._resolve_query(query)
+            if error:
+                return error
             
             # TRACE POINT 2: Search execution
             logger.trace("SEARCH", f"Executing search: {search_query[:100]}")
             result = self.search_tool.invoke(search_query)
             
-            # TRACE POINT 3: Format results
-            logger.trace("FORMAT", f"Formatting result type: {type(result)}")
-            formatted_result = self._format_result(result)
+            return self._complete_search(search_query, result)
+            
+        except Exception as e:
+            return self._search_failed(e)
+    
+    async def _aexecute_search(self, query: Any) -> str:
+        """
+        Async counterpart of _execute_search using search_tool.ainvoke.
+        
+        Args:
+            query: Search query (string or dict)
+            
+        Returns:
+            Formatted search results, limited to 2000 chars
+        """
+        try:
+            search_query, error = self._resolve_query(query)
+            if error:
+                return error
             
-            logger.observe(
-                "search_complete",
-                query_length=len(search_query),
-                result_length=len(formatted_result),
-                success=True
-            )
+            logger.trace("SEARCH", f"Executing async search: {search_query[:100]}")
+            result = await self.search_tool.ainvoke(search_query)
             
-            return formatted_result
+            return self._complete_search(search_query, result)
             
         except Exception as e:
-            logger.error(f"Error in Tavily search: {str(e)}", exc_info=True)
-            logger.observe("search_complete", success=False, error=str(e))
-            return f"I encountered an error while searching: {str(e)}"
+            return self._search_failed(e)
+    
+    def _resolve_query(self, query: Any) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Validate the query and extract the search string.
+        
+        Args:
+            query: Search query (string or dict)
+            
+        Returns:
+            Tuple of (search query, None) or (None, error message)
+        """
+        # TRACE POINT 1: Validation
+        logger.trace("VALIDATE", f"Validating search query: {type(query)}")
+        
+        if not query:
+            logger.warning("Empty query provided")
+            return None, "No search query provided."
+        
+        # Handle both string and dict queries
+        search_query = query.get('query', '') if isinstance(query, dict) else str(query)
+        if not search_query.strip():
+            logger.warning("Empty search query after processing")
+            return None, "Empty search query provided."
+        
+        return search_query, None
+    
+    def _complete_search(self, search_query: str, result: Any) -> str:
+        """Format a raw search result and record search metrics."""
+        # TRACE POINT 3: Format results
+        logger.trace("FORMAT", f"Formatting result type: {type(result)}")
+        formatted_result = self._format_result(result)
+        
+        logger.observe(
+            "search_complete",
+            query_length=len(search_query),
+            result_length=len(formatted_result),
+            success=True
+        )
+        
+        return formatted_result
+    
+    def _search_failed(self, e: Exception) -> str:
+        """Log a failed search and build the user-facing error message."""
+        logger.error(f"Error in Tavily search: {str(e)}", exc_info=True)
+        logger.observe("search_complete", success=False, error=str(e))
+        return f"I encountered an error while searching: {str(e)}"
     
     @traceable()
     def _format_result(self, result: Any) -> str:
@@ -207,7 +327,7 @@ class TavilySearchTool(BaseTool):
         # String result
         if isinstance(result, str):
             logger.trace("FORMAT", "Result is string, truncating")
-            return result[:2000]
+            return _truncate_result(result)
         
         # Dict result
         if isinstance(result, dict):
@@ -223,11 +343,11 @@ class TavilySearchTool(BaseTool):
             
             # Generic dict
             logger.trace("FORMAT", "Generic dict format")
-            return str(result)[:2000]
+            return _truncate_result(result)
         
         # Other types
         logger.trace("FORMAT", "Fallback to string conversion")
-        return str(result)[:2000]
+        return _truncate_result(result)
     
     def _format_weather(self, result: Dict) -> str:
         """
@@ -6,7 +6,7 @@ PURPOSE: Evaluate user social skills and manage training with OTE tracking
 
 TRACE POINTS:
     - VALIDATE: Input validation
-    - WEB_RESEARCH: Fetch latest empathy research
+    - WEB_RESEARCH: Fetch latest empathy research (cached per context)
     - ANALYZE: Message skill analysis
     - DB_GET_SKILLS: Retrieve current skill levels
     - DB_UPDATE_SKILL: Update skill level in database
@@ -23,12 +23,19 @@ OTE COMPLIANCE:
     - Evaluation: Skill detection metrics, performance tracking
 """
 
+import asyncio
 import atexit
+import re
+import threading
+import time
+import weakref
+from concurrent.futures import Future
 from typing import Type, Optional, Any, Dict, List
 from langchain.tools import BaseTool
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from datamanager.data_manager import DataManager
+from tools.schema_input import FastArgsSchemaMixin
 from app.utils import get_logger, observe, traceable, evaluate
 
 # Get logger for this module
@@ -48,16 +55,38 @@ except ImportError:
     SKILL_AGENTS_AVAILABLE = False
     SkillEvaluationOrchestrator = None
 
-# Import web search for research
+# Web search for research (shared client, created on first use)
 try:
-    from langchain_tavily import TavilySearch
-    tavily_search = TavilySearch(max_results=10)
+    import langchain_tavily  # noqa: F401
+    from tools.search import get_tavily_search, RESEARCH_MAX_RESULTS
     WEB_SEARCH_AVAILABLE = True
     logger.info("✅ Web search available")
 except ImportError:
     logger.warning("⚠️  Tavily search not available. Web research disabled.")
     WEB_SEARCH_AVAILABLE = False
-    tavily_search = None
+
+# Optional multi-pattern matcher for skill keywords (regex fallback otherwise)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Skill name -> ID per database, shared by every SkillEvaluator on the same
+# DataManager (agents build their own evaluator, but skill IDs never change)
+_SKILL_IDS_BY_DM: "weakref.WeakKeyDictionary[DataManager, Dict[str, int]]" = weakref.WeakKeyDictionary()
+
+# Web research per normalized cultural context: (fetched_at, result). The
+# query only varies by context, so one Tavily call per context per TTL window
+# is enough. Contexts come from LLM tool input, so the cache is bounded (oldest
+# entry evicted first). Concurrent misses for the same context wait on the
+# first caller's in-flight Future; entries leave _RESEARCH_INFLIGHT when the
+# fetch ends. _RESEARCH_LOCK only guards the dicts, never the HTTP call.
+_RESEARCH_TTL = 24 * 3600
+_RESEARCH_CACHE_MAXSIZE = 64
+_RESEARCH_CACHE: Dict[str, tuple] = {}
+_RESEARCH_INFLIGHT: Dict[str, Future] = {}
+_RESEARCH_LOCK = threading.Lock()
 
 
 class SkillEvaluatorInput(BaseModel):
@@ -78,7 +107,7 @@ class SkillEvaluatorInput(BaseModel):
     use_web_research: Optional[bool] = Field(default=True, description="Whether to fetch latest research")
 
 
-class SkillEvaluator(BaseTool):
+class SkillEvaluator(FastArgsSchemaMixin, BaseTool):
     """
     Evaluates user social skills based on chat interactions with OTE tracking.
     
@@ -96,8 +125,8 @@ class SkillEvaluator(BaseTool):
         name: Tool name for LLM
         description: Tool description for LLM
         args_schema: Pydantic schema for validation
-        dm: DataManager instance
-        orchestrator: Multi-agent skill evaluation orchestrator
+        _dm: DataManager instance
+        orchestrator: Multi-agent skill evaluation orchestrator (lazy)
         skills: Dictionary of skills and their keywords
     
     Example:
@@ -117,35 +146,25 @@ class SkillEvaluator(BaseTool):
         "Analyzes messages for active listening, empathy, clarity, and engagement."
     )
     args_schema: Type[BaseModel] = SkillEvaluatorInput
-    dm: DataManager = None
-    orchestrator: Optional[Any] = None  # SkillEvaluationOrchestrator or None
+    _dm: DataManager = PrivateAttr(default=None)
     skills: Dict[str, Dict[str, Any]] = {}
 
     def __init__(self, data_manager: DataManager):
         """
-        Initialize SkillEvaluator with orchestrator and skill definitions.
+        Initialize SkillEvaluator with skill definitions.
         
         Args:
             data_manager: DataManager instance for database operations
         """
         super().__init__()
-        self.dm = data_manager
+        self._dm = data_manager
         
         logger.trace("INIT", "Initializing skill evaluator")
         
-        # Initialize orchestrator if available
-        if SKILL_AGENTS_AVAILABLE:
-            try:
-                self.orchestrator = get_evaluation_orchestrator(data_manager)
-                logger.info("✅ Skill orchestrator initialized")
-            except Exception as e:
-                logger.error(f"Failed to initialize orchestrator: {e}")
-                self.orchestrator = None
-        else:
-            self.orchestrator = None
-        
-        # Register cleanup handler
-        atexit.register(self.cleanup)
+        # Orchestrator worker threads start on first use of .orchestrator,
+        # not here (Pydantic workaround for non-field attributes)
+        object.__setattr__(self, '_orchestrator', None)
+        object.__setattr__(self, '_orchestrator_requested', False)
 
         # Define skills for training purposes
         self.skills = {
@@ -166,8 +185,91 @@ class SkillEvaluator(BaseTool):
                 "keywords": ["what do you think", "how about you"],
             },
         }
+        self._compile_keywords()
+        
+        # Description and suggestion text depend only on the static skill
+        # definitions, so build them once (Pydantic workaround)
+        object.__setattr__(self, '_skill_texts', {
+            skill_name: (
+                data.get("description", "No description available"),
+                f"Try using phrases like: {', '.join(data['keywords'][:2])}..."
+                if data.get('keywords') else "Keep practicing to improve this skill"
+            )
+            for skill_name, data in self.skills.items()
+        })
+        
+        # Skill name -> ID, resolved on first use and shared per DataManager
+        # (Pydantic workaround)
+        object.__setattr__(self, '_skill_ids', _SKILL_IDS_BY_DM.setdefault(data_manager, {}))
+        
+        logger.observe("init_complete", skills=len(self.skills), orchestrator=SKILL_AGENTS_AVAILABLE)
+
+    @property
+    def orchestrator(self) -> Optional[Any]:
+        """
+        Multi-agent evaluation orchestrator, created on first access.
         
-        logger.observe("init_complete", skills=len(self.skills), orchestrator=bool(self.orchestrator))
+        Starting the orchestrator spins up its worker agents, so it is
+        deferred until something needs it; cleanup is registered with
+        atexit at that point.
+        
+        Returns:
+            SkillEvaluationOrchestrator, or None if skill agents are
+            unavailable or failed to start
+        """
+        if not self._orchestrator_requested:
+            object.__setattr__(self, '_orchestrator_requested', True)
+            if SKILL_AGENTS_AVAILABLE:
+                try:
+                    object.__setattr__(self, '_orchestrator', get_evaluation_orchestrator(self._dm))
+                    atexit.register(self.cleanup)
+                    logger.info("✅ Skill orchestrator initialized")
+                except Exception as e:
+                    logger.error(f"Failed to initialize orchestrator: {e}")
+        return self._orchestrator
+
+    def _compile_keywords(self) -> None:
+        """
+        Compile all skill keywords for single-pass matching.
+        
+        With pyahocorasick an automaton reports every keyword occurrence,
+        nested and overlapping ones included, in one linear scan.
+        
+        Otherwise a regex lookahead reports every position where a keyword
+        starts, so overlapping keywords are all found. At a given position
+        only the longest keyword is reported, so each keyword also maps to
+        the shorter keywords that are its prefixes (e.g. "i understand how
+        you feel" also implies "i understand").
+        """
+        keyword_skills: Dict[str, List[tuple]] = {}
+        for skill_name, data in self.skills.items():
+            for kw in data.get('keywords', []):
+                keyword_skills.setdefault(kw.lower(), []).append((skill_name, kw))
+        
+        if AHOCORASICK_AVAILABLE and keyword_skills:
+            automaton = ahocorasick.Automaton()
+            for kw, hits in keyword_skills.items():
+                automaton.add_word(kw, hits)
+            automaton.make_automaton()
+            # Pydantic workaround for non-field attributes
+            object.__setattr__(self, '_keyword_automaton', automaton)
+            object.__setattr__(self, '_keyword_pattern', None)
+            object.__setattr__(self, '_keyword_hits', {})
+            return
+        
+        ordered = sorted(keyword_skills, key=len, reverse=True)
+        pattern = re.compile(
+            "(?=(" + "|".join(re.escape(kw) for kw in ordered) + "))"
+        ) if ordered else None
+        keyword_hits = {
+            kw: [hit for other in ordered if kw.startswith(other) for hit in keyword_skills[other]]
+            for kw in ordered
+        }
+        
+        # Pydantic workaround for non-field attributes
+        object.__setattr__(self, '_keyword_automaton', None)
+        object.__setattr__(self, '_keyword_pattern', pattern)
+        object.__setattr__(self, '_keyword_hits', keyword_hits)
 
     def cleanup(self, user_id: int = None):
         """
@@ -178,7 +280,8 @@ class SkillEvaluator(BaseTool):
         """
         logger.trace("CLEANUP", "Cleaning up skill evaluator resources")
         
-        if self.orchestrator:
+        # Nothing to stop if the orchestrator was never started
+        if self._orchestrator is not None:
             try:
                 if user_id is not None:
                     suggestions = self.get_skill_suggestions(user_id)
@@ -244,7 +347,7 @@ class SkillEvaluator(BaseTool):
             
             # TRACE POINT 2: Web research
             latest_standards = None
-            if use_web_research and WEB_SEARCH_AVAILABLE and tavily_search:
+            if use_web_research and WEB_SEARCH_AVAILABLE:
                 latest_standards = self._fetch_research(cultural_context)
             
             # TRACE POINT 3: Get current skill levels BEFORE analysis
@@ -253,10 +356,8 @@ class SkillEvaluator(BaseTool):
             
             # TRACE POINT 4: Analyze message for skill demonstration
             logger.trace("ANALYZE", f"Analyzing message for skills")
-            analysis = self._analyze_message_skills(
-                message if isinstance(message, str) else str(messages),
-                cultural_context
-            )
+            text = message if isinstance(message, str) else "\n".join(map(str, filter(None, messages)))
+            analysis = self._analyze_message_skills(text, cultural_context)
             
             # TRACE POINT 5: Update database with detected skills
             skills_updated = self._update_detected_skills(user_id, analysis)
@@ -298,8 +399,14 @@ class SkillEvaluator(BaseTool):
         """
         Fetch latest empathy and social skills research from web.
         
+        Results are cached per cultural context (case and surrounding
+        whitespace ignored) for _RESEARCH_TTL seconds, at most
+        _RESEARCH_CACHE_MAXSIZE contexts; failed fetches are not cached.
+        Concurrent misses for one context share a single fetch, while
+        misses for different contexts fetch in parallel.
+        
         TRACE PATH:
-            WEB_RESEARCH → API call → Result processing
+            WEB_RESEARCH → Cache lookup → API call → Result processing
         
         Args:
             cultural_context: Cultural context for research query
@@ -309,30 +416,60 @@ class SkillEvaluator(BaseTool):
         """
         logger.trace("WEB_RESEARCH", f"Fetching research for context={cultural_context}")
         
+        key = " ".join(cultural_context.split()).lower()
+        with _RESEARCH_LOCK:
+            cached = _RESEARCH_CACHE.get(key)
+            if cached and time.monotonic() - cached[0] < _RESEARCH_TTL:
+                logger.observe("research_fetched", cached=True, success=True)
+                return dict(cached[1])
+            pending = _RESEARCH_INFLIGHT.get(key)
+            if pending is None:
+                pending = _RESEARCH_INFLIGHT[key] = Future()
+                is_fetcher = True
+            else:
+                is_fetcher = False
+        
+        if not is_fetcher:
+            # Another caller is fetching this context; share its result
+            latest_standards = pending.result()
+            return dict(latest_standards) if latest_standards else None
+        
+        latest_standards = None
         try:
-            research_query = f"latest {cultural_context} empathy social skills research 2024 2025"
-            research_result = tavily_search.invoke(research_query)
+            # Built from the normalized key, so the cached query does not
+            # depend on which caller's casing arrived first
+            research_query = f"latest {key} empathy social skills research 2024 2025"
+            research_result = get_tavily_search(RESEARCH_MAX_RESULTS).invoke(research_query)
             
             latest_standards = {
                 "query": research_query,
                 "research": str(research_result)[:500],  # Limit to 500 chars
                 "updated": "2025-11-12"
             }
-            
             logger.observe("research_fetched", query_length=len(research_query), success=True)
-            return latest_standards
+            return dict(latest_standards)
             
         except Exception as e:
             logger.error(f"Web research failed: {e}")
             logger.observe("research_fetched", success=False)
             return None
+        finally:
+            with _RESEARCH_LOCK:
+                if latest_standards is not None:
+                    _RESEARCH_CACHE.pop(key, None)
+                    if len(_RESEARCH_CACHE) >= _RESEARCH_CACHE_MAXSIZE:
+                        del _RESEARCH_CACHE[next(iter(_RESEARCH_CACHE))]
+                    _RESEARCH_CACHE[key] = (time.monotonic(), latest_standards)
+                del _RESEARCH_INFLIGHT[key]
+            pending.set_result(latest_standards)
     
     @traceable()
     def _analyze_message_skills(self, message: str, cultural_context: str = "Western") -> Dict[str, Any]:
         """
         Analyze a message for social skill demonstration.
         
-        Uses keyword matching to detect skills in the message.
+        Uses a precompiled keyword automaton (or pattern) to detect skills
+        in one pass.
         More sophisticated analysis could use ML/NLP.
         
         Args:
@@ -344,13 +481,27 @@ class SkillEvaluator(BaseTool):
         """
         logger.trace("ANALYZE", f"Analyzing message of length={len(message)}")
         
-        message_lower = message.lower()
-        detected_skills = []
+        # Single pass over the message collects keyword hits for all skills
+        if self._keyword_automaton is not None:
+            hit_lists = (hits for _, hits in self._keyword_automaton.iter(message.lower()))
+        elif self._keyword_pattern is not None:
+            hit_lists = (
+                self._keyword_hits[match.group(1)]
+                for match in self._keyword_pattern.finditer(message.lower())
+            )
+        else:
+            hit_lists = ()
         
-        for skill_name, data in self.skills.items():
-            keywords = data.get('keywords', [])
-            keywords_found = [kw for kw in keywords if kw.lower() in message_lower]
-            
+        found: Dict[str, List[str]] = {}
+        for hits in hit_lists:
+            for skill_name, kw in hits:
+                keywords_found = found.setdefault(skill_name, [])
+                if kw not in keywords_found:
+                    keywords_found.append(kw)
+        
+        detected_skills = []
+        for skill_name in self.skills:
+            keywords_found = found.get(skill_name)
             if keywords_found:
                 detected_skills.append({
                     "skill": skill_name,
@@ -398,16 +549,16 @@ class SkillEvaluator(BaseTool):
                     logger.trace("DB_UPDATE_SKILL", f"Updating skill={skill_name} for user={user_id}")
                     
                     # Get or create the skill
-                    skill = self.dm.get_or_create_skill(skill_name)
+                    skill = self._dm.get_or_create_skill(skill_name)
                     if skill:
                         # Get current level
-                        current_level = self.dm.get_skilllevel_for_user(user_id, skill.id) or 0
+                        current_level = self._dm.get_skilllevel_for_user(user_id, skill.id) or 0
                         
                         # Increment level (max 10)
                         new_level = min(current_level + 1, 10)
                         
                         # Update in database
-                        self.dm.set_skill_for_user(user_id, skill, new_level)
+                        self._dm.set_skill_for_user(user_id, skill, new_level)
                         skills_updated.append({
                             "skill": skill_name,
                             "old_level": current_level,
@@ -421,6 +572,25 @@ class SkillEvaluator(BaseTool):
         logger.observe("skills_updated", count=len(skills_updated))
         return skills_updated
     
+    def _get_skill_ids(self) -> Dict[str, int]:
+        """
+        Resolve skill names to database IDs once.
+        
+        Skills are static after creation, so the IDs are memoized per
+        DataManager; later calls, including from other SkillEvaluator
+        instances on the same database, need no queries.
+        
+        Returns:
+            Dictionary mapping skill name to skill ID
+        """
+        if len(self._skill_ids) < len(self.skills):
+            for skill_name in self.skills:
+                if skill_name not in self._skill_ids:
+                    skill = self._dm.get_or_create_skill(skill_name)
+                    if skill:
+                        self._skill_ids[skill_name] = skill.id
+        return self._skill_ids
+    
     @traceable()
     def get_skill_suggestions(self, user_id: int) -> List[Dict[str, Any]]:
         """
@@ -436,22 +606,24 @@ class SkillEvaluator(BaseTool):
         
         suggestions = []
         try:
-            for skill_name, data in self.skills.items():
-                skill = self.dm.get_or_create_skill(skill_name)
-                if not skill:
+            # One query for all skill levels instead of two per skill
+            skill_ids = self._get_skill_ids()
+            levels = self._dm.get_skilllevels_for_user(user_id, list(skill_ids.values()))
+            
+            for skill_name, (description, suggestion_text) in self._skill_texts.items():
+                skill_id = skill_ids.get(skill_name)
+                if skill_id is None:
                     continue
                     
-                level = self.dm.get_skilllevel_for_user(user_id, skill.id)
-                if level is None:
-                    level = 0
+                level = levels.get(skill_id, 0)
                     
                 # Build suggestion
                 suggestion = {
                     "skill": skill_name,
                     "current_level": level,
                     "max_level": 10,
-                    "description": data.get("description", "No description available"),
-                    "suggestion": f"Try using phrases like: {', '.join(data.get('keywords', ['practice more'])[:2])}..." if data.get('keywords') else "Keep practicing to improve this skill",
+                    "description": description,
+                    "suggestion": suggestion_text,
                     "needs_improvement": level < 7
                 }
                 
@@ -484,6 +656,7 @@ class SkillEvaluator(BaseTool):
         Async version of run.
         
         Note:
-            Currently calls sync version. Can be optimized for async operations.
+            Runs the sync evaluation in a worker thread so DB access does
+            not block the event loop.
         """
-        return self._run(*args, **kwargs)
+        return await asyncio.to_thread(self._run, *args, **kwargs)
@@ -22,16 +22,28 @@ OTE COMPLIANCE:
     - Evaluation: Success/failure tracking, performance metrics
 """
 
+import asyncio
 from typing import Type, Optional, Any, Dict, List
 from langchain.tools import BaseTool
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from datamanager.data_manager import DataManager
+from tools.schema_input import FastArgsSchemaMixin
 from app.utils import get_logger, observe, traceable, evaluate
 
 # Get logger for this module
 logger = get_logger(__name__)
 
+# Preference types whose values are encrypted at rest (see _is_sensitive_type)
+SENSITIVE_PREFERENCE_TYPES = frozenset({
+    'personal_info',
+    'contact',
+    'financial',
+    'medical',
+    'identification',
+    'private',
+})
+
 
 class UserPreferenceInput(BaseModel):
     """
@@ -53,7 +65,7 @@ class UserPreferenceInput(BaseModel):
     confidence: Optional[float] = Field(default=None, description="Confidence score 0-1")
 
 
-class UserPreferenceTool(BaseTool):
+class UserPreferenceTool(FastArgsSchemaMixin, BaseTool):
     """
     Tool for managing user preferences with encryption for sensitive data.
     
@@ -70,7 +82,7 @@ class UserPreferenceTool(BaseTool):
         name: Tool name for LLM
         description: Tool description for LLM
         args_schema: Pydantic schema for validation
-        dm: DataManager instance for database operations
+        _dm: DataManager instance for database operations
         encryptor: Encryption handler (optional)
     
     Example:
@@ -93,7 +105,7 @@ class UserPreferenceTool(BaseTool):
         "Personal data (name, DOB, sensitive info) is automatically encrypted."
     )
     args_schema: Type[BaseModel] = UserPreferenceInput
-    dm: DataManager = None
+    _dm: DataManager = PrivateAttr(default=None)
     encryptor: Optional[Any] = None
     
     def __init__(self, data_manager: DataManager):
@@ -108,7 +120,14 @@ class UserPreferenceTool(BaseTool):
             with a warning logged.
         """
         super().__init__()
-        self.dm = data_manager
+        self._dm = data_manager
+        
+        # Action dispatch table (Pydantic workaround)
+        object.__setattr__(self, '_actions', {
+            "get": self._handle_get,
+            "set": self._handle_set,
+            "delete": self._handle_delete,
+        })
         
         # Initialize encryption for sensitive data
         logger.trace("INIT", "Initializing encryption")
@@ -165,18 +184,14 @@ class UserPreferenceTool(BaseTool):
             return {"status": "error", "message": "user_id is required"}
         
         try:
-            if action == "get":
-                return self._handle_get(user_id, kwargs)
-            elif action == "set":
-                return self._handle_set(user_id, kwargs)
-            elif action == "delete":
-                return self._handle_delete(user_id, kwargs)
-            else:
+            handler = self._actions.get(action)
+            if handler is None:
                 logger.warning(f"Invalid action: {action}")
                 return {
                     "status": "error",
                     "message": f"Invalid action: {action}. Must be one of: get, set, delete"
                 }
+            return handler(user_id, kwargs)
                 
         except Exception as e:
             logger.error(f"Error in UserPreferenceTool: {str(e)}", exc_info=True)
@@ -205,10 +220,12 @@ class UserPreferenceTool(BaseTool):
         
         # TRACE POINT 2: Database retrieval
         logger.trace("DB_GET", f"Retrieving preferences for user={user_id}, type={preference_type}")
-        preferences_dict = self.dm.get_user_preferences(user_id, preference_type)
+        preferences_dict = self._dm.get_user_preferences(user_id, preference_type)
         
         # Decrypt sensitive preferences
         decrypted_prefs = []
+        to_decrypt: List[int] = []
+        sensitive: Dict[str, bool] = {}  # classified once per preference type
         
         if preferences_dict:
             for full_key, value in preferences_dict.items():
@@ -219,26 +236,35 @@ class UserPreferenceTool(BaseTool):
                     pref_type = "general"
                     pref_key = full_key
                 
-                # TRACE POINT 3: Decryption check
-                decrypted_value = value
-                is_encrypted = False
-                
-                if self.encryptor and self._is_sensitive_type(pref_type):
-                    if value and self.encryptor.is_encrypted(value):
-                        logger.trace("DECRYPT", f"Decrypting {full_key}")
-                        try:
-                            decrypted_value = self.encryptor.decrypt(value)
-                            is_encrypted = True
-                        except Exception as e:
-                            logger.error(f"Decryption error for {full_key}: {e}")
+                # TRACE POINT 3: Decryption check (decrypted in one batch below)
+                if pref_type not in sensitive:
+                    sensitive[pref_type] = self._is_sensitive_type(pref_type)
+                if (self.encryptor and sensitive[pref_type]
+                        and value and self.encryptor.is_encrypted(value)):
+                    to_decrypt.append(len(decrypted_prefs))
                 
                 decrypted_prefs.append({
                     "preference_type": pref_type,
                     "preference_key": pref_key,
-                    "preference_value": decrypted_value,
-                    "encrypted": is_encrypted
+                    "preference_value": value,
+                    "encrypted": False
                 })
         
+        if to_decrypt:
+            logger.trace("DECRYPT", f"Decrypting {len(to_decrypt)} preferences")
+            plaintexts = self.encryptor.decrypt_many(
+                [decrypted_prefs[i]["preference_value"] for i in to_decrypt]
+            )
+            for i, plaintext in zip(to_decrypt, plaintexts):
+                pref = decrypted_prefs[i]
+                if plaintext is None:
+                    logger.error(
+                        f"Decryption error for {pref['preference_type']}.{pref['preference_key']}"
+                    )
+                    continue
+                pref["preference_value"] = plaintext
+                pref["encrypted"] = True
+        
         logger.observe("get_complete", records=len(decrypted_prefs), encrypted=bool(self.encryptor))
         
         return {
@@ -291,7 +317,7 @@ class UserPreferenceTool(BaseTool):
         
         # TRACE POINT 5: Database save
         logger.trace("DB_SET", f"Saving preference to database")
-        success = self.dm.set_user_preference(
+        success = self._dm.set_user_preference(
             user_id=user_id,
             preference_type=preference_type,
             preference_key=kwargs["preference_key"],
@@ -341,7 +367,7 @@ class UserPreferenceTool(BaseTool):
         
         # TRACE POINT 6: Database deletion
         logger.trace("DB_DELETE", f"Deleting preferences for type={preference_type}, key={preference_key}")
-        success = self.dm.delete_user_preference(
+        success = self._dm.delete_user_preference(
             user_id=user_id,
             preference_type=preference_type,
             preference_key=preference_key
@@ -378,21 +404,16 @@ class UserPreferenceTool(BaseTool):
         Returns:
             bool: True if sensitive data requiring encryption
         """
-        sensitive_types = {
-            'personal_info',
-            'contact',
-            'financial',
-            'medical',
-            'identification',
-            'private'
-        }
-        return preference_type.lower() in sensitive_types
+        if not preference_type.islower():
+            preference_type = preference_type.lower()
+        return preference_type in SENSITIVE_PREFERENCE_TYPES
     
     async def _arun(self, *args, **kwargs):
         """
         Async version of run.
         
         Note:
-            Currently calls sync version. Can be optimized for async DB operations.
+            Runs the sync DB operations in a worker thread so they do not
+            block the event loop.
         """
-        return self._run(*args, **kwargs)
+        return await asyncio.to_thread(self._run, *args, **kwargs)